@@ -5,13 +5,32 @@ load_dotenv()
 
 class Settings:
     database_url: str = os.getenv("DATABASE_URL", "postgresql://localhost:5432/paper_birthdays")
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
     semantic_scholar_api_key: str = os.getenv("SEMANTIC_SCHOLAR_API_KEY", "")
     
     # API settings
     arxiv_rate_limit_seconds: int = 3
     semantic_scholar_rate_limit_seconds: int = 1
     
+    # Daily job settings
+    max_parallel_categories: int = int(os.getenv("MAX_PARALLEL_CATEGORIES", "3"))
+    
     # Cache settings
     cache_ttl_hours: int = 24
+    cache_max_entries: int = 1024
+    negative_cache_ttl_minutes: int = 30
+    cache_dir: str = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+    citation_cache_days: int = 7
+    # Optional Redis cache shared by all worker processes, e.g. redis://localhost:6379/0
+    redis_url: str = os.getenv("REDIS_URL", "")
+    redis_timeout_seconds: float = 0.5
+    cache_fill_lock_seconds: int = 300
+    arxiv_page_cache_days: int = 7
+    # Comma-separated categories whose daily selection the API computes at startup
+    # and just after midnight ("all" for the main page); empty (the default) to
+    # disable. Every worker process warms on its own, so with several workers
+    # set REDIS_URL as well to share the result and the arXiv fetch.
+    warmup_categories: str = os.getenv("WARMUP_CATEGORIES", "")
 
 settings = Settings()
\ No newline at end of file
@@ -16,27 +16,53 @@ Usage:
 import argparse
 import logging
 import sys
-import traceback
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Set, Tuple
 
-from paper_service import PaperService
-from database import SessionLocal, FetchHistory
+from sqlalchemy import bindparam, select
+
+from paper_service import PaperService, get_paper_service
+from database import SessionLocal, FetchHistory, get_already_fetched
 from config import settings
 
-# Default categories to pre-fetch
-DEFAULT_CATEGORIES = [
-    None,                  # Main page (all categories)
-    'cs.AI',              # Artificial Intelligence
-    'cs.LG',              # Machine Learning  
-    'cs.CL',              # Computation and Language
-    'cs.CV',              # Computer Vision
-    'math.GT',            # Geometric Topology
-    'physics.gen-ph',     # General Physics
-    'q-bio.GN',           # Genomics
-    'econ.EM',            # Econometrics
-    'stat.ML'             # Machine Learning (Statistics)
-]
+
+@dataclass(frozen=True)
+class CategoryMeta:
+    """Per-category constants used when processing a category"""
+    label: str
+    display_name: str
+
+
+# The categories pre-fetched by default and their constants, built once at
+# import so workers only look them up
+CATEGORY_META: Mapping[Optional[str], CategoryMeta] = MappingProxyType({
+    None: CategoryMeta("all categories", "All Categories"),
+    'cs.AI': CategoryMeta('cs.AI', "Artificial Intelligence"),
+    'cs.LG': CategoryMeta('cs.LG', "Machine Learning"),
+    'cs.CL': CategoryMeta('cs.CL', "Computation and Language"),
+    'cs.CV': CategoryMeta('cs.CV', "Computer Vision"),
+    'math.GT': CategoryMeta('math.GT', "Geometric Topology"),
+    'physics.gen-ph': CategoryMeta('physics.gen-ph', "General Physics"),
+    'q-bio.GN': CategoryMeta('q-bio.GN', "Genomics"),
+    'econ.EM': CategoryMeta('econ.EM', "Econometrics"),
+    'stat.ML': CategoryMeta('stat.ML', "Machine Learning (Statistics)"),
+})
+
+# Default categories to pre-fetch (None for the main page), in processing order
+DEFAULT_CATEGORIES: Tuple[Optional[str], ...] = tuple(CATEGORY_META)
+
+
+def get_category_meta(category: Optional[str]) -> CategoryMeta:
+    """Get metadata for a category, falling back to the raw name for non-default ones"""
+    meta = CATEGORY_META.get(category)
+    if meta is None:
+        meta = CategoryMeta(category or "all categories", category or "All Categories")
+    return meta
+
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -66,7 +92,7 @@ def setup_logging(verbose: bool = False) -> None:
     # Set up logger for this module
     logger.setLevel(level)
     
-    logger.info(f"Logging configured at {'DEBUG' if verbose else 'INFO'} level")
+    logger.info("Logging configured at %s level", 'DEBUG' if verbose else 'INFO')
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -125,6 +151,19 @@ Examples:
     return args
 
 
+# Built once; IS NOT DISTINCT FROM matches a NULL category the same way as a
+# named one, so every call shares a single statement cache entry
+_FETCH_CHECK_STMT = (
+    select(FetchHistory.id)
+    .where(
+        FetchHistory.fetch_date == bindparam("fetch_date"),
+        FetchHistory.status == 'success',
+        FetchHistory.category.is_not_distinct_from(bindparam("category"))
+    )
+    .limit(1)
+)
+
+
 def check_if_already_fetched(target_date: date, category: Optional[str]) -> bool:
     """
     Check if papers have already been successfully fetched for this date/category
@@ -136,35 +175,45 @@ def check_if_already_fetched(target_date: date, category: Optional[str]) -> bool
     Returns:
         True if already fetched successfully, False otherwise
     """
-    db = SessionLocal()
     try:
-        # Look for successful fetch history for this date/category
-        query = db.query(FetchHistory).filter(
-            FetchHistory.fetch_date == target_date,
-            FetchHistory.status == 'success'
-        )
-        
-        if category:
-            query = query.filter(FetchHistory.category == category)
-        else:
-            query = query.filter(FetchHistory.category.is_(None))
-        
-        existing_fetch = query.first()
+        with SessionLocal() as db:
+            # Look for successful fetch history for this date/category
+            existing_fetch = db.execute(
+                _FETCH_CHECK_STMT, {"fetch_date": target_date, "category": category or None}
+            ).scalar()
         
         if existing_fetch:
-            logger.info(f"Papers already fetched successfully for {target_date}, category: {category or 'all'}")
+            logger.info("Papers already fetched successfully for %s, category: %s", target_date, category or 'all')
             return True
         
         return False
         
     except Exception as e:
-        logger.error(f"Error checking fetch history: {e}")
+        logger.error("Error checking fetch history: %s", e)
         return False
-    finally:
-        db.close()
 
 
-def process_single_category(paper_service: PaperService, target_date: date, category: Optional[str], dry_run: bool) -> bool:
+def get_fetched_categories(target_date: date, categories: Sequence[Optional[str]]) -> Optional[Set[Optional[str]]]:
+    """
+    Look up which categories were already fetched successfully, in a single query
+    
+    Args:
+        target_date: The date to check
+        categories: Categories to check (None entry for all categories)
+        
+    Returns:
+        Set of already fetched categories, or None if the lookup failed
+    """
+    try:
+        with SessionLocal() as db:
+            return get_already_fetched(db, target_date, categories)
+    except Exception as e:
+        logger.error("Error checking fetch history: %s", e)
+        return None
+
+
+def process_single_category(paper_service: PaperService, target_date: date, category: Optional[str], dry_run: bool,
+                            already_fetched: Optional[Set[Optional[str]]] = None) -> bool:
     """
     Process papers for a single category
     
@@ -173,92 +222,116 @@ def process_single_category(paper_service: PaperService, target_date: date, cate
         target_date: Date to process
         category: Category to process (None for all categories)
         dry_run: If True, only log what would be done
+        already_fetched: Prefetched set of already fetched categories (checked per category if None)
         
     Returns:
         True if successful, False otherwise
     """
-    category_name = category or "all categories"
+    category_meta = get_category_meta(category)
+    category_name = category_meta.label
     
     try:
-        logger.info(f"Processing category: {category_name}")
+        logger.info("Processing category: %s (%s)", category_name, category_meta.display_name)
         
         if dry_run:
-            logger.info(f"DRY RUN: Would fetch papers for {target_date}, category: {category_name}")
+            logger.info("DRY RUN: Would fetch papers for %s, category: %s", target_date, category_name)
             return True
         
         # Check if already fetched
-        if check_if_already_fetched(target_date, category):
-            logger.info(f"Skipping {category_name} - already fetched successfully")
+        if already_fetched is not None:
+            is_fetched = category in already_fetched
+        else:
+            is_fetched = check_if_already_fetched(target_date, category)
+        
+        if is_fetched:
+            logger.info("Skipping %s - already fetched successfully", category_name)
             return True
         
         # Fetch papers using PaperService
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         selected_paper = paper_service.get_daily_paper(target_date, category)
-        end_time = datetime.now()
-        
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         if selected_paper:
-            logger.info(f"Successfully fetched paper for {category_name}: {selected_paper['title'][:100]}...")
-            logger.info(f"Processing time: {processing_time:.2f} seconds")
+            logger.info("Successfully fetched paper for %s: %.100s...", category_name, selected_paper['title'])
+            logger.info("Processing time: %.2f seconds", processing_time)
             return True
         else:
-            logger.warning(f"No papers found for {category_name}")
+            logger.warning("No papers found for %s", category_name)
             return False
             
     except Exception as e:
-        logger.error(f"Error processing category {category_name}: {e}")
-        logger.debug(f"Stack trace: {traceback.format_exc()}")
+        logger.error("Error processing category %s: %s", category_name, e)
+        logger.debug("Stack trace:", exc_info=True)
         return False
 
 
-def process_categories(target_date: date, categories: List[Optional[str]], dry_run: bool) -> Tuple[int, int]:
+def process_categories(target_date: date, categories: Sequence[Optional[str]], dry_run: bool) -> Tuple[int, int]:
     """
     Process papers for multiple categories
     
     Args:
         target_date: Date to process
-        categories: List of categories to process
+        categories: Categories to process
         dry_run: If True, only log what would be done
         
     Returns:
         Tuple of (success_count, failure_count)
     """
-    paper_service = PaperService()
+    paper_service = get_paper_service()
     success_count = 0
     failure_count = 0
     
     total_categories = len(categories)
+    max_workers = max(1, min(settings.max_parallel_categories, total_categories))
     
-    for i, category in enumerate(categories, 1):
-        category_name = category or "all categories"
-        
-        logger.info(f"[{i}/{total_categories}] Starting category: {category_name}")
-        
+    # Resolve fetch history for every category up front in one round-trip
+    already_fetched = None if dry_run else get_fetched_categories(target_date, categories)
+    pending_categories = [c for c in categories if not already_fetched or c not in already_fetched]
+    
+    # Every category searches the same historical dates, so fetch each date once
+    # across all categories and let the categories filter it in memory
+    if not dry_run and len(pending_categories) > 1:
         try:
-            success = process_single_category(paper_service, target_date, category, dry_run)
-            
-            if success:
-                success_count += 1
-                logger.info(f"[{i}/{total_categories}] ✓ Completed category: {category_name}")
-            else:
-                failure_count += 1
-                logger.warning(f"[{i}/{total_categories}] ✗ Failed category: {category_name}")
-                
+            historical_dates = paper_service.get_last_10_years_dates(target_date)
+            paper_service.prefetch_papers(historical_dates)
         except Exception as e:
-            failure_count += 1
-            logger.error(f"[{i}/{total_categories}] ✗ Exception in category {category_name}: {e}")
+            logger.warning("Prefetch failed, categories will be fetched individually: %s", e)
+    
+    # Categories are independent and I/O bound, so process them concurrently.
+    # API politeness is preserved by the clients' shared rate limiters.
+    logger.info("Processing %d categories with up to %d workers", total_categories, max_workers)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_single_category, paper_service, target_date, category, dry_run, already_fetched): category
+                for category in categories
+            }
             
-        # Add small delay between categories to be respectful to APIs
-        if not dry_run and i < total_categories:
-            logger.debug("Pausing briefly between categories...")
-            import time
-            time.sleep(2)
+            for i, future in enumerate(as_completed(futures), 1):
+                category_name = get_category_meta(futures[future]).label
+                
+                try:
+                    success = future.result()
+                    
+                    if success:
+                        success_count += 1
+                        logger.info("[%d/%d] ✓ Completed category: %s", i, total_categories, category_name)
+                    else:
+                        failure_count += 1
+                        logger.warning("[%d/%d] ✗ Failed category: %s", i, total_categories, category_name)
+                        
+                except Exception as e:
+                    failure_count += 1
+                    logger.error("[%d/%d] ✗ Exception in category %s: %s", i, total_categories, category_name, e)
+    finally:
+        paper_service.clear_prefetched_papers()
     
     return success_count, failure_count
 
 
-def log_job_summary(target_date: date, categories: List[Optional[str]], success_count: int, failure_count: int, execution_time: float, dry_run: bool) -> None:
+def log_job_summary(target_date: date, categories: Sequence[Optional[str]], success_count: int, failure_count: int, execution_time: float, dry_run: bool) -> None:
     """
     Log summary of job execution
     
@@ -276,23 +349,23 @@ def log_job_summary(target_date: date, categories: List[Optional[str]], success_
     logger.info("=" * 60)
     logger.info("DAILY JOB SUMMARY")
     logger.info("=" * 60)
-    logger.info(f"Date processed: {target_date}")
-    logger.info(f"Dry run mode: {'Yes' if dry_run else 'No'}")
-    logger.info(f"Total categories: {total_categories}")
-    logger.info(f"Successful: {success_count}")
-    logger.info(f"Failed: {failure_count}")
-    logger.info(f"Success rate: {success_rate:.1f}%")
-    logger.info(f"Execution time: {execution_time:.2f} seconds")
+    logger.info("Date processed: %s", target_date)
+    logger.info("Dry run mode: %s", 'Yes' if dry_run else 'No')
+    logger.info("Total categories: %d", total_categories)
+    logger.info("Successful: %d", success_count)
+    logger.info("Failed: %d", failure_count)
+    logger.info("Success rate: %.1f%%", success_rate)
+    logger.info("Execution time: %.2f seconds", execution_time)
     logger.info("=" * 60)
     
     if failure_count > 0:
-        logger.warning(f"⚠️  {failure_count} categories failed. Check logs above for details.")
+        logger.warning("⚠️  %d categories failed. Check logs above for details.", failure_count)
     
     if not dry_run:
         if failure_count == 0:
             logger.info("🎉 All categories processed successfully!")
         elif success_count > 0:
-            logger.info(f"✅ Partial success: {success_count}/{total_categories} categories completed")
+            logger.info("✅ Partial success: %d/%d categories completed", success_count, total_categories)
         else:
             logger.error("❌ Complete failure: No categories processed successfully")
 
@@ -318,7 +391,7 @@ def get_exit_code(success_count: int, failure_count: int) -> int:
 
 def main() -> None:
     """Main entry point for daily job"""
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         # Parse command line arguments
@@ -329,24 +402,23 @@ def main() -> None:
         
         # Determine target date and categories
         target_date = args.date or date.today()
-        categories = [args.category] if args.category else DEFAULT_CATEGORIES
+        categories = (args.category,) if args.category else DEFAULT_CATEGORIES
         
         logger.info("Starting Paper Birthdays daily job")
-        logger.info(f"Target date: {target_date}")
-        logger.info(f"Categories to process: {len(categories)}")
+        logger.info("Target date: %s", target_date)
+        logger.info("Categories to process: %d", len(categories))
         
         if args.dry_run:
             logger.info("🔍 DRY RUN MODE - No actual fetching will be performed")
         
         if args.verbose:
-            logger.debug(f"Categories: {[c or 'all' for c in categories]}")
+            logger.debug("Categories: %s", [c or 'all' for c in categories])
         
         # Process categories
         success_count, failure_count = process_categories(target_date, categories, args.dry_run)
         
         # Calculate execution time
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         
         # Log summary
         log_job_summary(target_date, categories, success_count, failure_count, execution_time, args.dry_run)
@@ -360,8 +432,8 @@ def main() -> None:
         sys.exit(130)  # Standard exit code for SIGINT
         
     except Exception as e:
-        logger.error(f"Unexpected error in daily job: {e}")
-        logger.debug(f"Stack trace: {traceback.format_exc()}")
+        logger.error("Unexpected error in daily job: %s", e)
+        logger.debug("Stack trace:", exc_info=True)
         sys.exit(2)  # Complete failure
 
 
@@ -1,13 +1,26 @@
-from sqlalchemy import create_engine, MetaData, Column, Integer, String, Text, Date, DateTime, JSON, ARRAY, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import create_engine, select, or_, MetaData, Column, Integer, String, Text, Date, DateTime, ARRAY, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship
 from sqlalchemy.sql import func
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Optional, List, Set, Iterable
+import orjson
 from config import settings
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    query_cache_size=1200,
+    # orjson emits bytes; the driver needs text for json/jsonb parameters
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+# Thread-local sessions: repeated short-lived use within one thread (e.g. a
+# daily job worker) reuses the same session instead of building a new one
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 Base = declarative_base()
 
 
@@ -16,11 +29,10 @@ class Paper(Base):
     """Paper model representing academic papers"""
     __tablename__ = "papers"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    arxiv_id = Column(String(50), unique=True, nullable=False)
+    arxiv_id = Column(String(50), primary_key=True)  # Natural key, known to every caller
     title = Column(Text, nullable=False)
     abstract = Column(Text, nullable=False)
-    authors = Column(JSON, nullable=False)  # Array of author objects
+    authors = Column(JSONB, nullable=False)  # Array of author objects
     categories = Column(ARRAY(String), nullable=False)  # TEXT[] array
     primary_category = Column(String(20), nullable=False)
     submitted_date = Column(Date, nullable=False)
@@ -29,8 +41,8 @@ class Paper(Base):
     abstract_url = Column(Text, nullable=False)
     citation_count = Column(Integer, default=0)
     semantic_scholar_id = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     featured_papers = relationship("DailyFeaturedPaper", back_populates="paper")
@@ -46,16 +58,16 @@ class DailyFeaturedPaper(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     feature_date = Column(Date, nullable=False)
     category = Column(String(20), nullable=True)  # NULL for main page
-    paper_id = Column(Integer, ForeignKey("papers.id"), nullable=False)
+    paper_arxiv_id = Column(String(50), ForeignKey("papers.arxiv_id"), nullable=False)
     rank_in_day = Column(Integer, nullable=False)  # 1-10 ranking by citations
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     paper = relationship("Paper", back_populates="featured_papers")
     
     # Unique constraint
     __table_args__ = (
-        UniqueConstraint('feature_date', 'category', 'paper_id', name='_feature_date_category_paper_uc'),
+        UniqueConstraint('feature_date', 'category', 'paper_arxiv_id', name='_feature_date_category_paper_uc'),
     )
     
     def __repr__(self):
@@ -73,7 +85,7 @@ class FetchHistory(Base):
     papers_fetched = Column(Integer, nullable=True)
     status = Column(String(20), nullable=False)  # 'success', 'partial', 'failed'
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, default=datetime.utcnow)
     
     def __repr__(self):
         return f"<FetchHistory(date='{self.fetch_date}', type='{self.fetch_type}', status='{self.status}')>"
@@ -83,13 +95,21 @@ class FetchHistory(Base):
 Index('idx_papers_submitted_date', Paper.submitted_date)
 Index('idx_papers_primary_category', Paper.primary_category)
 Index('idx_papers_citation_count', Paper.citation_count)
+Index('idx_papers_authors_gin', Paper.authors, postgresql_using='gin')
+# Serves the unfiltered history listing (scanned backwards for feature_date DESC)
 Index('idx_daily_featured_date', DailyFeaturedPaper.feature_date)
-Index('idx_daily_featured_category', DailyFeaturedPaper.category)
-Index('idx_fetch_history_date', FetchHistory.fetch_date)
+# Serves the per-category history listing as an index range scan in page order;
+# the leading column also covers plain category lookups
+Index('idx_daily_featured_category_date', DailyFeaturedPaper.category, DailyFeaturedPaper.feature_date.desc())
+# Covers "already fetched?" lookups as index-only scans; also serves plain date lookups
+Index('idx_fetch_history_lookup', FetchHistory.fetch_date, FetchHistory.status, FetchHistory.category,
+      postgresql_include=['id'])
 
 def get_db():
     """Dependency to get database session"""
-    db = SessionLocal()
+    # Use a dedicated session per request rather than the thread-local one,
+    # since FastAPI may resolve dependencies on a shared threadpool
+    db = SessionLocal.session_factory()
     try:
         yield db
     finally:
@@ -118,41 +138,100 @@ def create_tables():
 
 
 # Basic CRUD operations for Paper model
+def _upsert_papers_stmt(paper_dicts: List[dict]):
+    """Build the INSERT ... ON CONFLICT DO UPDATE statement for upsert_papers()"""
+    # Postgres rejects a statement that updates the same row twice, so keep
+    # only the last dictionary for each arXiv ID
+    unique_papers = list({paper_dict['arxiv_id']: paper_dict for paper_dict in paper_dicts}.values())
+    
+    stmt = pg_insert(Paper).values(unique_papers)
+    return stmt.on_conflict_do_update(
+        index_elements=[Paper.arxiv_id],
+        set_={
+            'title': stmt.excluded.title,
+            'abstract': stmt.excluded.abstract,
+            'updated_date': stmt.excluded.updated_date,
+            'citation_count': func.greatest(Paper.citation_count, stmt.excluded.citation_count),
+            'updated_at': datetime.utcnow(),
+        }
+    )
+
+
+def upsert_papers(db: SessionLocal, paper_dicts: List[dict]) -> List[Paper]:
+    """
+    Insert papers, or update existing ones matched on arXiv ID, in a single statement.
+    Citation counts only ever increase. The caller is responsible for committing.
+    """
+    if not paper_dicts:
+        return []
+    
+    stmt = _upsert_papers_stmt(paper_dicts).returning(Paper)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).all()
+
+
+def upsert_paper_ids(db: SessionLocal, paper_dicts: List[dict]) -> List[str]:
+    """
+    Same as upsert_papers(), but only return the arXiv IDs of the stored papers
+    instead of loading them into the session
+    """
+    if not paper_dicts:
+        return []
+    
+    stmt = _upsert_papers_stmt(paper_dicts).returning(Paper.arxiv_id)
+    return db.scalars(stmt).all()
+
+
 def create_paper(db: SessionLocal, paper_data: dict) -> Paper:
-    """Create a new paper"""
-    paper = Paper(**paper_data)
-    db.add(paper)
+    """Create a new paper (or update the existing one with the same arXiv ID)"""
+    paper = upsert_papers(db, [paper_data])[0]
     db.commit()
-    db.refresh(paper)
     return paper
 
 
-def get_paper_by_id(db: SessionLocal, paper_id: int) -> Optional[Paper]:
-    """Get paper by ID"""
-    return db.query(Paper).filter(Paper.id == paper_id).first()
-
-
 def get_paper_by_arxiv_id(db: SessionLocal, arxiv_id: str) -> Optional[Paper]:
     """Get paper by arXiv ID"""
-    return db.query(Paper).filter(Paper.arxiv_id == arxiv_id).first()
+    # Primary key lookup, served from the session's identity map when possible
+    return db.get(Paper, arxiv_id)
 
 
 def get_papers_by_date(db: SessionLocal, submitted_date: date, limit: int = 100) -> List[Paper]:
     """Get papers by submission date"""
-    return db.query(Paper).filter(Paper.submitted_date == submitted_date).limit(limit).all()
+    return db.execute(select(Paper).where(Paper.submitted_date == submitted_date).limit(limit)).scalars().all()
 
 
 def get_papers_by_category(db: SessionLocal, category: str, limit: int = 100) -> List[Paper]:
     """Get papers by primary category"""
-    return db.query(Paper).filter(Paper.primary_category == category).limit(limit).all()
+    return db.execute(select(Paper).where(Paper.primary_category == category).limit(limit)).scalars().all()
 
 
-def update_paper_citation_count(db: SessionLocal, paper_id: int, citation_count: int) -> Optional[Paper]:
+def update_paper_citation_count(db: SessionLocal, arxiv_id: str, citation_count: int) -> Optional[Paper]:
     """Update paper citation count"""
-    paper = db.query(Paper).filter(Paper.id == paper_id).first()
+    paper = get_paper_by_arxiv_id(db, arxiv_id)
     if paper:
         paper.citation_count = citation_count
-        paper.updated_at = func.current_timestamp()
+        paper.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(paper)
-    return paper
\ No newline at end of file
+    return paper
+
+
+# Fetch history helpers
+def get_already_fetched(db: SessionLocal, target_date: date, categories: Iterable[Optional[str]]) -> Set[Optional[str]]:
+    """Get the subset of categories (None for all categories) already fetched successfully for a date"""
+    categories = list(categories)
+    named_categories = [c for c in categories if c]
+    
+    conditions = []
+    if named_categories:
+        conditions.append(FetchHistory.category.in_(named_categories))
+    if len(named_categories) < len(categories):
+        conditions.append(FetchHistory.category.is_(None))
+    
+    if not conditions:
+        return set()
+    
+    query = select(FetchHistory.category).distinct().where(
+        FetchHistory.fetch_date == target_date,
+        FetchHistory.status == 'success',
+        or_(*conditions)
+    )
+    return set(db.execute(query).scalars())
@@ -0,0 +1,126 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+import orjson
+
+from config import settings
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_MAX_KEYS_PER_QUERY = 500
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with per-entry expiry that persists across runs
+    
+    Values are stored as JSON (via orjson), never pickled, so a tampered cache
+    file cannot execute code. Dataclasses come back as dicts and dates as ISO
+    strings; callers rebuild richer types themselves.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache (expires_at)")
+            # Drop entries left behind by earlier runs
+            self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, or default if missing or expired"""
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get all unexpired values for the given keys"""
+        keys = list(keys)
+        now = time.time()
+        found = {}
+
+        with self._lock:
+            for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[i:i + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({placeholders}) "
+                    "AND (expires_at IS NULL OR expires_at >= ?)",
+                    (*chunk, now)
+                ).fetchall()
+                for key, value in rows:
+                    try:
+                        found[key] = orjson.loads(value)
+                    except orjson.JSONDecodeError as e:
+                        # e.g. written by an older version of the cache; treat as a miss
+                        logger.warning(f"Ignoring unreadable disk cache entry {key}: {e}")
+
+        return found
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """Store a value, optionally expiring after ttl_seconds"""
+        self.set_many({key: value}, ttl_seconds)
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: Optional[float] = None):
+        """Store several values in one transaction, pruning expired entries"""
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        rows = [
+            (key, orjson.dumps(value), expires_at)
+            for key, value in items.items()
+        ]
+
+        with self._lock, self._conn:
+            # Long-running processes would otherwise keep expired values (e.g.
+            # multi-MB arXiv pages) until the next restart; SQLite reuses the
+            # freed pages for the new rows
+            self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", rows
+            )
+
+    def delete(self, key: str):
+        """Remove a value"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove all values"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=None)
+def get_disk_cache(name: str) -> Optional[DiskCache]:
+    """
+    Get the shared disk cache with the given name, stored under settings.cache_dir
+
+    Returns:
+        DiskCache instance, or None if disk caching is disabled or unavailable
+    """
+    if not settings.cache_dir:
+        return None
+
+    try:
+        os.makedirs(settings.cache_dir, exist_ok=True)
+        return DiskCache(os.path.join(settings.cache_dir, f"{name}.sqlite"))
+    except Exception as e:
+        logger.warning(f"Disk cache '{name}' unavailable, continuing without it: {e}")
+        return None
@@ -1,16 +1,65 @@
+import base64
 import httpx
+import orjson
+import random
 import time
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from config import settings
+from disk_cache import get_disk_cache
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Request/parse constants, built once at import rather than per call
+# Fully qualified (Clark notation) tags, so lookups skip namespace prefix resolution
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_TAG_ENTRY = _ATOM + "entry"
+_TAG_ID = _ATOM + "id"
+_TAG_TITLE = _ATOM + "title"
+_TAG_SUMMARY = _ATOM + "summary"
+_TAG_AUTHOR = _ATOM + "author"
+_TAG_NAME = _ATOM + "name"
+_TAG_CATEGORY = _ATOM + "category"
+_TAG_PUBLISHED = _ATOM + "published"
+_TAG_UPDATED = _ATOM + "updated"
+_TAG_LINK = _ATOM + "link"
+_TAG_TOTAL_RESULTS = "{http://a9.com/-/spec/opensearch/1.1/}totalResults"
+ARXIV_SORT_PARAMS = {"sortBy": "submittedDate", "sortOrder": "descending"}
+SEMANTIC_SCHOLAR_FIELDS = "fields=paperId,title,citationCount"
+# Connection pool bounds for each client's long-lived httpx.Client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+# Semantic Scholar requests are multiplexed over HTTP/2, so fewer connections are needed
+SEMANTIC_SCHOLAR_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=5, max_connections=10, keepalive_expiry=30.0)
+# Concurrent page requests per arXiv search (launches are still rate limited)
+ARXIV_PAGE_WORKERS = 3
+# Bytes read from the network per arXiv parser feed
+ARXIV_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _strip_version(arxiv_id: str) -> str:
+    """Remove a trailing version suffix (e.g. 2301.12345v3 -> 2301.12345), leaving other v's alone"""
+    head, sep, version = arxiv_id.rpartition('v')
+    return head if sep and version.isdigit() and head[-1:].isdigit() else arxiv_id
+
+
+@lru_cache(maxsize=1024)
+def build_arxiv_search_query(date_str: str, category: Optional[str] = None) -> str:
+    """Build the arXiv search_query for a YYYYMMDD date and optional category"""
+    search_query = f"submittedDate:[{date_str}0000 TO {date_str}2359]"
+    if category:
+        search_query += f" AND cat:{category}"
+    return search_query
+
+@dataclass(slots=True)
 class ArxivPaper:
     """Data class for arXiv paper response"""
     arxiv_id: str
@@ -24,7 +73,18 @@ class ArxivPaper:
     pdf_url: str
     abstract_url: str
 
-@dataclass
+def _arxiv_paper_from_cache(cached: Dict[str, Any]) -> ArxivPaper:
+    """Rebuild an ArxivPaper from its JSON form in the disk cache"""
+    updated_date = cached["updated_date"]
+    return ArxivPaper(
+        cached["arxiv_id"], cached["title"], cached["abstract"], cached["authors"],
+        cached["categories"], cached["primary_category"],
+        date.fromisoformat(cached["submitted_date"]),
+        date.fromisoformat(updated_date) if updated_date else None,
+        cached["pdf_url"], cached["abstract_url"]
+    )
+
+@dataclass(slots=True)
 class SemanticScholarPaper:
     """Data class for Semantic Scholar paper response"""
     paper_id: str
@@ -33,43 +93,171 @@ class SemanticScholarPaper:
     citation_count: int
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter allowing short bursts up to capacity"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum number of tokens (requests) that can be spent at once
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, n: float = 1):
+        """Take n tokens, sleeping until they are available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            # Reserve the tokens now (possibly going into debt) so waiters queue fairly
+            self._tokens -= n
+            sleep_time = -self._tokens / self.refill_rate if self._tokens < 0 else 0
+        
+        if sleep_time > 0:
+            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
+    
+    def drain(self, for_seconds: float = 0):
+        """Empty the bucket, holding back every caller for at least for_seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._last_refill) * self.refill_rate, -for_seconds * self.refill_rate)
+            self._last_refill = now
+
+
+def get_retry_delay(response: httpx.Response, default: float) -> float:
+    """
+    Get how long to wait before retrying a rate limited response
+    
+    Args:
+        response: The 429 response
+        default: Delay to use if the response has no usable Retry-After header
+        
+    Returns:
+        Delay in seconds, with up to 50% random jitter so parallel callers spread out
+    """
+    retry_after = response.headers.get("Retry-After")
+    delay = default
+    
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            # Retry-After may also be an HTTP date
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    
+    delay = max(delay, 0)
+    return delay + random.uniform(0, 0.5 * delay)
+
+
 class ArxivClient:
     """HTTP client for arXiv API with rate limiting"""
     
+    # Rate limit state is shared by every instance so that concurrent callers
+    # (e.g. parallel categories in the daily job) still respect arXiv's limit.
+    # arXiv asks for no bursts, so the bucket holds a single token.
+    _rate_limiter = TokenBucket(capacity=1, refill_rate=1 / settings.arxiv_rate_limit_seconds)
+    
     def __init__(self):
         self.base_url = "https://export.arxiv.org/api/query"
         self.rate_limit_seconds = settings.arxiv_rate_limit_seconds
-        self.last_request_time = 0
         self.timeout = 10
         self.max_retries = 3
+        # Long-lived client so connections are kept alive across requests
+        # Atom XML compresses well; httpx decompresses transparently
+        self._client = httpx.Client(timeout=self.timeout, follow_redirects=True, limits=HTTP_LIMITS,
+                                    headers={"Accept-Encoding": "gzip"})
+        # Search results persisted for cache_ttl_hours (None if unavailable)
+        self.results_cache = get_disk_cache("arxiv")
+        # Raw pages with their ETag/Last-Modified validators (None if unavailable)
+        self.page_cache = get_disk_cache("arxiv_pages")
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        time_since_last_request = time.time() - self.last_request_time
-        if time_since_last_request < self.rate_limit_seconds:
-            sleep_time = self.rate_limit_seconds - time_since_last_request
-            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Enforce rate limiting between requests across all instances and threads"""
+        self._rate_limiter.acquire()
     
-    def _make_request_with_retry(self, url: str, params: Dict[str, Any]) -> str:
-        """Make HTTP request with retry logic and exponential backoff"""
+    def _make_request_with_retry(self, url: str, params: Dict[str, Any],
+                                 handle_body: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Make HTTP request with retry logic and exponential backoff
+        
+        The response body is streamed to handle_body as byte chunks if given (and
+        retried as a whole if reading it fails), otherwise it is returned as raw bytes.
+        Pages the server supplied an ETag or Last-Modified for are revalidated with
+        a conditional request, and a 304 replays the stored body.
+        """
+        page_key = f"{url}?{urlencode(sorted(params.items()))}"
+        stored_page = self.page_cache.get(page_key) if self.page_cache is not None else None
+        headers = {}
+        if stored_page:
+            if stored_page.get("etag"):
+                headers["If-None-Match"] = stored_page["etag"]
+            if stored_page.get("last_modified"):
+                headers["If-Modified-Since"] = stored_page["last_modified"]
+        
         for attempt in range(self.max_retries):
             try:
                 self._enforce_rate_limit()
                 
-                with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                    response = client.get(url, params=params)
-                    
+                with self._client.stream("GET", url, params=params, headers=headers) as response:
                     if response.status_code == 429:
-                        # Rate limited - wait longer and retry
-                        wait_time = (2 ** attempt) * self.rate_limit_seconds
-                        logger.warning(f"Rate limited by arXiv API. Waiting {wait_time} seconds before retry {attempt + 1}")
-                        time.sleep(wait_time)
+                        # Rate limited - hold back all callers sharing the limiter,
+                        # this retry included, for as long as the server asks
+                        wait_time = get_retry_delay(response, (2 ** attempt) * self.rate_limit_seconds)
+                        logger.warning(f"Rate limited by arXiv API. Waiting {wait_time:.1f} seconds before retry {attempt + 1}")
+                        self._rate_limiter.drain(wait_time)
                         continue
                     
+                    if response.status_code == 304 and stored_page:
+                        logger.info(f"arXiv page not modified, reusing stored response for {page_key}")
+                        body = base64.b64decode(stored_page["body"])
+                        return handle_body([body]) if handle_body is not None else body
+                    
                     response.raise_for_status()
-                    return response.text
+                    
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if self.page_cache is None or not (etag or last_modified):
+                        # Nothing to revalidate with later, so don't keep the body
+                        if handle_body is not None:
+                            return handle_body(response.iter_bytes(ARXIV_STREAM_CHUNK_SIZE))
+                        # Raw bytes go straight to the XML parser, skipping a decode/re-encode
+                        return response.read()
+                    
+                    # Keep a copy of the body as it streams past for the next revalidation
+                    chunks = []
+                    
+                    def recorded_chunks():
+                        for chunk in response.iter_bytes(ARXIV_STREAM_CHUNK_SIZE):
+                            chunks.append(chunk)
+                            yield chunk
+                    
+                    result = handle_body(recorded_chunks()) if handle_body is not None else b"".join(recorded_chunks())
+                    self.page_cache.set(
+                        page_key,
+                        {"etag": etag, "last_modified": last_modified,
+                         "body": base64.b64encode(b"".join(chunks)).decode("ascii")},
+                        ttl_seconds=settings.arxiv_page_cache_days * 86400
+                    )
+                    return result
                     
             except httpx.TimeoutException:
                 logger.warning(f"Timeout on attempt {attempt + 1}/{self.max_retries}")
@@ -91,7 +279,8 @@ class ArxivClient:
         
         raise Exception("Max retries exceeded")
     
-    def search_papers_by_date(self, date: date, category: str = None, max_results: int = None) -> List[ArxivPaper]:
+    def search_papers_by_date(self, date: date, category: str = None, max_results: int = None,
+                              raise_on_failure: bool = False) -> List[ArxivPaper]:
         """
         Search for papers by submission date with automatic pagination to get ALL papers
         
@@ -99,172 +288,234 @@ class ArxivClient:
             date: The submission date to search for
             category: Optional category filter (e.g., 'cs.CL')
             max_results: Maximum number of results to return (None = get all papers for the date)
+            raise_on_failure: Raise instead of returning an empty list when the first
+                page cannot be fetched, so an outage is not mistaken for "no papers"
             
         Returns:
             List of ArxivPaper objects
         """
-        # Format date for arXiv query
-        date_str = date.strftime("%Y%m%d")
-        search_query = f"submittedDate:[{date_str}0000 TO {date_str}2359]"
-        
-        # Add category filter if specified
-        if category:
-            search_query += f" AND cat:{category}"
-        
-        params = {
-            "search_query": search_query,
-            "start": 0,
-            "max_results": max_results,
-            "sortBy": "submittedDate",
-            "sortOrder": "descending"
-        }
+        papers, _ = self.search_papers_by_date_with_status(date, category, max_results, raise_on_failure)
+        return papers
+    
+    def search_papers_by_date_with_status(self, date: date, category: str = None, max_results: int = None,
+                                          raise_on_failure: bool = False) -> Tuple[List[ArxivPaper], bool]:
+        """
+        Like search_papers_by_date, but also report whether every page was fetched
+        
+        Returns:
+            Tuple of (list of ArxivPaper objects, whether the results are complete)
+        """
+        # Format date for arXiv query, with the category filter if specified
+        search_query = build_arxiv_search_query(date.strftime("%Y%m%d"), category)
+        
+        # Complete result sets are cached on disk, keyed by query
+        use_cache = self.results_cache is not None and not max_results
+        if use_cache:
+            cached_papers = self.results_cache.get(search_query)
+            if cached_papers is not None:
+                cached_papers = [_arxiv_paper_from_cache(cached) for cached in cached_papers]
+                logger.info(f"Using {len(cached_papers)} cached arXiv papers for {date} with query: {search_query}")
+                return cached_papers, True
         
         logger.info(f"Searching arXiv for papers on {date} with query: {search_query}")
         
-        all_papers = []
-        start = 0
+        complete = True
         batch_size = 1000  # arXiv allows up to 2000, but 1000 is safer for reliability
         
-        while True:
+        def fetch_page(start: int) -> Tuple[List[ArxivPaper], Optional[int]]:
             params = {
                 "search_query": search_query,
                 "start": start,
                 "max_results": batch_size,
-                "sortBy": "submittedDate", 
-                "sortOrder": "descending"
+                **ARXIV_SORT_PARAMS
             }
+            return self._make_request_with_retry(self.base_url, params, self._parse_arxiv_chunks)
+        
+        try:
+            papers, total_results = fetch_page(0)
+        except Exception as e:
+            logger.error(f"Failed to search arXiv papers for date {date} at start=0: {e}")
+            if raise_on_failure:
+                raise
+            papers, total_results = [], None
+            complete = False
+        
+        all_papers = list(papers)
+        
+        if len(papers) == batch_size and total_results is not None:
+            # The first page reports the total, so request the remaining pages
+            # concurrently. The shared rate limiter still spaces out requests,
+            # but downloading and parsing one page overlaps the wait for the next.
+            end = min(total_results, max_results) if max_results else total_results
+            starts = list(range(batch_size, end, batch_size))
             
-            try:
-                xml_response = self._make_request_with_retry(self.base_url, params)
-                papers = self.parse_arxiv_response(xml_response)
+            with ThreadPoolExecutor(max_workers=ARXIV_PAGE_WORKERS) as executor:
+                futures = [executor.submit(fetch_page, start) for start in starts]
                 
-                if not papers:
-                    # No more papers to fetch
-                    break
+                for start, future in zip(starts, futures):
+                    try:
+                        papers, _ = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to search arXiv papers for date {date} at start={start}: {e}")
+                        papers = []
+                        complete = False
                     
-                all_papers.extend(papers)
+                    all_papers.extend(papers)
+                    
+                    # Stop at the first short page; return what we have so far
+                    if len(papers) < batch_size:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    
+                    logger.info(f"Progress: fetched {len(all_papers)} papers so far for {date}")
+        
+        elif len(papers) == batch_size:
+            # No total reported, page through until a short page
+            start = batch_size
+            while not max_results or len(all_papers) < max_results:
+                try:
+                    papers, _ = fetch_page(start)
+                except Exception as e:
+                    logger.error(f"Failed to search arXiv papers for date {date} at start={start}: {e}")
+                    complete = False
+                    break
                 
-                # If we got fewer papers than requested, we've reached the end
+                all_papers.extend(papers)
                 if len(papers) < batch_size:
                     break
-                    
-                # If user specified max_results and we've exceeded it, truncate and break
-                if max_results and len(all_papers) >= max_results:
-                    all_papers = all_papers[:max_results]
-                    break
-                    
                 start += batch_size
-                
-                # Log progress for long fetches
-                if len(all_papers) > 0 and len(all_papers) % 1000 == 0:
-                    logger.info(f"Progress: fetched {len(all_papers)} papers so far for {date}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to search arXiv papers for date {date} at start={start}: {e}")
-                # Return what we have so far rather than failing completely
-                break
+        
+        if max_results:
+            all_papers = all_papers[:max_results]
         
         logger.info(f"Found {len(all_papers)} total papers from arXiv for date {date}")
-        return all_papers
+        
+        # Partial results are not cached so the next call retries the missing pages
+        if use_cache and complete and all_papers:
+            self.results_cache.set(search_query, all_papers, ttl_seconds=settings.cache_ttl_hours * 3600)
+        
+        return all_papers, complete
     
-    def parse_arxiv_response(self, xml_response: str) -> List[ArxivPaper]:
+    def parse_arxiv_response(self, xml_response: Union[bytes, str]) -> List[ArxivPaper]:
         """
         Parse arXiv XML response into ArxivPaper objects
         
         Args:
-            xml_response: Raw XML response from arXiv API
+            xml_response: Raw XML response body from arXiv API (bytes, or str)
             
         Returns:
             List of parsed ArxivPaper objects
         """
+        return self._parse_arxiv_feed(xml_response)[0]
+    
+    def _parse_arxiv_feed(self, xml_response: Union[bytes, str]) -> Tuple[List[ArxivPaper], Optional[int]]:
+        """Parse a complete arXiv XML response, see _parse_arxiv_chunks"""
+        return self._parse_arxiv_chunks([xml_response.encode('utf-8') if isinstance(xml_response, str) else xml_response])
+    
+    def _parse_arxiv_chunks(self, chunks: Iterable[bytes]) -> Tuple[List[ArxivPaper], Optional[int]]:
+        """
+        Parse arXiv XML into ArxivPaper objects and the feed's total result count
+        
+        Entries are parsed incrementally as chunks arrive and discarded once
+        converted, so neither the full body nor the document tree is held in memory.
+        
+        Args:
+            chunks: The XML response body as an iterable of byte chunks
+            
+        Returns:
+            Tuple of (parsed ArxivPaper objects, opensearch:totalResults or None if absent)
+        """
         papers = []
+        append_paper = papers.append  # hoisted out of the per-entry loop
+        total_results = None
         
         try:
-            # Parse XML
-            root = ET.fromstring(xml_response)
-            
-            # Define namespace
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
+            parser = etree.XMLPullParser(events=('end',), tag=(_TAG_ENTRY, _TAG_TOTAL_RESULTS))
             
-            # Find all entry elements
-            entries = root.findall('atom:entry', ns)
-            
-            for entry in entries:
-                try:
-                    # Extract arXiv ID from URL
-                    arxiv_url = entry.find('atom:id', ns).text
-                    arxiv_id = arxiv_url.split('/')[-1]
-                    
-                    # Clean up arXiv ID (remove version number for main ID)
-                    if 'v' in arxiv_id:
-                        clean_arxiv_id = arxiv_id.split('v')[0]
-                    else:
-                        clean_arxiv_id = arxiv_id
-                    
-                    # Extract basic info
-                    title = entry.find('atom:title', ns).text.strip()
-                    abstract = entry.find('atom:summary', ns).text.strip()
-                    
-                    # Extract authors
-                    authors = []
-                    for author in entry.findall('atom:author', ns):
-                        name = author.find('atom:name', ns).text
-                        authors.append({"name": name})
-                    
-                    # Extract categories
-                    categories = []
-                    category_elements = entry.findall('atom:category', ns)
-                    for cat in category_elements:
-                        categories.append(cat.get('term'))
-                    
-                    primary_category = categories[0] if categories else "unknown"
-                    
-                    # Extract dates
-                    published_str = entry.find('atom:published', ns).text
-                    submitted_date = datetime.fromisoformat(published_str.replace('Z', '+00:00')).date()
-                    
-                    # Check for updated date
-                    updated_element = entry.find('atom:updated', ns)
-                    updated_date = None
-                    if updated_element is not None:
-                        updated_str = updated_element.text
-                        updated_date = datetime.fromisoformat(updated_str.replace('Z', '+00:00')).date()
-                        # Only set updated_date if it's different from submitted_date
-                        if updated_date == submitted_date:
-                            updated_date = None
-                    
-                    # Extract PDF URL
-                    pdf_url = ""
-                    for link in entry.findall('atom:link', ns):
-                        if link.get('type') == 'application/pdf':
-                            pdf_url = link.get('href')
-                            break
-                    
-                    # Construct abstract URL
-                    abstract_url = f"http://arxiv.org/abs/{clean_arxiv_id}"
-                    
-                    paper = ArxivPaper(
-                        arxiv_id=clean_arxiv_id,
-                        title=title,
-                        abstract=abstract,
-                        authors=authors,
-                        categories=categories,
-                        primary_category=primary_category,
-                        submitted_date=submitted_date,
-                        updated_date=updated_date,
-                        pdf_url=pdf_url,
-                        abstract_url=abstract_url
-                    )
-                    
-                    papers.append(paper)
+            for chunk in chunks:
+                parser.feed(chunk)
+                
+                for _, entry in parser.read_events():
+                    if entry.tag == _TAG_TOTAL_RESULTS:
+                        total_results = int(entry.text)
+                        continue
                     
-                except Exception as e:
-                    logger.warning(f"Failed to parse individual paper entry: {e}")
-                    continue
+                    try:
+                        findtext = entry.findtext
+                        
+                        # Required fields; entries missing any of them are skipped
+                        arxiv_url = findtext(_TAG_ID)
+                        title = findtext(_TAG_TITLE)
+                        abstract = findtext(_TAG_SUMMARY)
+                        published_str = findtext(_TAG_PUBLISHED)
+                        
+                        if not (arxiv_url and title and abstract and published_str):
+                            logger.warning(f"Skipping arXiv entry with missing fields: {arxiv_url or 'unknown id'}")
+                            continue
+                        
+                        # Extract arXiv ID from URL, keeping the archive of old-style IDs
+                        # (http://arxiv.org/abs/solv-int/9901001v1 -> solv-int/9901001v1)
+                        arxiv_id = arxiv_url.partition('/abs/')[2] or arxiv_url.rsplit('/', 1)[-1]
+                        
+                        # Clean up arXiv ID (remove version number for main ID)
+                        clean_arxiv_id = _strip_version(arxiv_id)
+                        
+                        # Extract basic info
+                        title = title.strip()
+                        abstract = abstract.strip()
+                        
+                        # Extract authors
+                        authors = [{"name": author.findtext(_TAG_NAME, "")} for author in entry.iterfind(_TAG_AUTHOR)]
+                        
+                        # Extract categories
+                        categories = [cat.get('term') for cat in entry.iterfind(_TAG_CATEGORY)]
+                        
+                        primary_category = categories[0] if categories else "unknown"
+                        
+                        # Extract dates (always ISO 8601 UTC, so the date is the first 10 characters)
+                        submitted_date = date.fromisoformat(published_str[:10])
+                        
+                        # Check for updated date
+                        updated_str = findtext(_TAG_UPDATED)
+                        updated_date = None
+                        if updated_str:
+                            updated_date = date.fromisoformat(updated_str[:10])
+                            # Only set updated_date if it's different from submitted_date
+                            if updated_date == submitted_date:
+                                updated_date = None
+                        
+                        # Extract PDF URL
+                        pdf_url = ""
+                        for link in entry.iterfind(_TAG_LINK):
+                            if link.get('type') == 'application/pdf':
+                                pdf_url = link.get('href')
+                                break
+                        
+                        # Construct abstract URL
+                        abstract_url = f"http://arxiv.org/abs/{clean_arxiv_id}"
+                        
+                        # Positional, in ArxivPaper field order
+                        append_paper(ArxivPaper(
+                            clean_arxiv_id, title, abstract, authors, categories, primary_category,
+                            submitted_date, updated_date, pdf_url, abstract_url
+                        ))
+                        
+                    except ValueError as e:
+                        # Malformed date
+                        logger.warning(f"Failed to parse individual paper entry: {e}")
+                        continue
+                    finally:
+                        # Release the processed entry and any earlier siblings
+                        entry.clear(keep_tail=True)
+                        while entry.getprevious() is not None:
+                            del entry.getparent()[0]
             
-            return papers
+            # Raises if the document was incomplete
+            parser.close()
+            
+            return papers, total_results
             
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.error(f"Failed to parse arXiv XML response: {e}")
             raise
         except Exception as e:
@@ -275,13 +526,31 @@ class ArxivClient:
 class SemanticScholarClient:
     """HTTP client for Semantic Scholar API with rate limiting"""
     
+    # Shared across instances, see ArxivClient
+    _rate_limiter = TokenBucket(capacity=1, refill_rate=1 / settings.semantic_scholar_rate_limit_seconds)
+    
     def __init__(self):
         self.base_url = "https://api.semanticscholar.org/graph/v1/paper"
+        self.batch_url = f"{self.base_url}/batch?{SEMANTIC_SCHOLAR_FIELDS}"
         self.rate_limit_seconds = settings.semantic_scholar_rate_limit_seconds
         self.api_key = settings.semantic_scholar_api_key
-        self.last_request_time = 0
         self.timeout = 10
         self.max_retries = 3
+        # Long-lived client so connections are kept alive across requests
+        self._client = httpx.Client(timeout=self.timeout, follow_redirects=True, http2=True,
+                                    limits=SEMANTIC_SCHOLAR_HTTP_LIMITS, headers=self._get_headers())
+        # Citation counts persisted between daily_job runs (None if unavailable)
+        self.citation_cache = get_disk_cache("citations")
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Semantic Scholar API requests"""
@@ -293,13 +562,8 @@ class SemanticScholarClient:
         return headers
     
     def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        time_since_last_request = time.time() - self.last_request_time
-        if time_since_last_request < self.rate_limit_seconds:
-            sleep_time = self.rate_limit_seconds - time_since_last_request
-            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Enforce rate limiting between requests across all instances and threads"""
+        self._rate_limiter.acquire()
     
     def _make_request_with_retry(self, url: str, method: str = "GET", json_data: Dict = None) -> Dict[str, Any]:
         """Make HTTP request with retry logic and exponential backoff"""
@@ -307,30 +571,28 @@ class SemanticScholarClient:
             try:
                 self._enforce_rate_limit()
                 
-                headers = self._get_headers()
+                if method == "GET":
+                    response = self._client.get(url)
+                elif method == "POST":
+                    response = self._client.post(url, json=json_data)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
                 
-                with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                    if method == "GET":
-                        response = client.get(url, headers=headers)
-                    elif method == "POST":
-                        response = client.post(url, headers=headers, json=json_data)
-                    else:
-                        raise ValueError(f"Unsupported HTTP method: {method}")
-                    
-                    if response.status_code == 429:
-                        # Rate limited - wait longer and retry
-                        wait_time = (2 ** attempt) * self.rate_limit_seconds
-                        logger.warning(f"Rate limited by Semantic Scholar API. Waiting {wait_time} seconds before retry {attempt + 1}")
-                        time.sleep(wait_time)
-                        continue
-                    
-                    if response.status_code == 404:
-                        # Paper not found - return None instead of raising error
-                        logger.info("Paper not found in Semantic Scholar")
-                        return None
-                    
-                    response.raise_for_status()
-                    return response.json()
+                if response.status_code == 429:
+                    # Rate limited - hold back all callers sharing the limiter,
+                    # this retry included, for as long as the server asks
+                    wait_time = get_retry_delay(response, (2 ** attempt) * self.rate_limit_seconds)
+                    logger.warning(f"Rate limited by Semantic Scholar API. Waiting {wait_time:.1f} seconds before retry {attempt + 1}")
+                    self._rate_limiter.drain(wait_time)
+                    continue
+                
+                if response.status_code == 404:
+                    # Paper not found - return None instead of raising error
+                    logger.info("Paper not found in Semantic Scholar")
+                    return None
+                
+                response.raise_for_status()
+                return orjson.loads(response.content)
                     
             except httpx.TimeoutException:
                 logger.warning(f"Timeout on attempt {attempt + 1}/{self.max_retries}")
@@ -363,11 +625,9 @@ class SemanticScholarClient:
             SemanticScholarPaper object or None if not found
         """
         # Clean arXiv ID (remove version if present)
-        clean_arxiv_id = arxiv_id.split('v')[0] if 'v' in arxiv_id else arxiv_id
+        clean_arxiv_id = _strip_version(arxiv_id)
         
-        url = f"{self.base_url}/arXiv:{clean_arxiv_id}"
-        params = "fields=paperId,externalIds,title,citationCount"
-        full_url = f"{url}?{params}"
+        full_url = f"{self.base_url}/arXiv:{clean_arxiv_id}?{SEMANTIC_SCHOLAR_FIELDS}"
         
         logger.info(f"Getting citations for arXiv paper: {clean_arxiv_id}")
         
@@ -404,36 +664,26 @@ class SemanticScholarClient:
         if len(arxiv_ids) > 500:
             raise ValueError("Batch size cannot exceed 500 papers")
         
-        # Clean arXiv IDs
-        clean_ids = []
-        for arxiv_id in arxiv_ids:
-            clean_id = arxiv_id.split('v')[0] if 'v' in arxiv_id else arxiv_id
-            clean_ids.append(f"arXiv:{clean_id}")
+        # Clean arXiv IDs (remove version if present)
+        clean_ids = [_strip_version(arxiv_id) for arxiv_id in arxiv_ids]
         
-        url = f"{self.base_url}/batch"
-        params = "fields=paperId,externalIds,title,citationCount"
-        full_url = f"{url}?{params}"
-        
-        json_data = {"ids": clean_ids}
+        json_data = {"ids": [f"arXiv:{clean_id}" for clean_id in clean_ids]}
         
         logger.info(f"Batch getting citations for {len(clean_ids)} papers")
         
         try:
-            response_data = self._make_request_with_retry(full_url, method="POST", json_data=json_data)
+            response_data = self._make_request_with_retry(self.batch_url, method="POST", json_data=json_data)
             
             papers = []
             
             if response_data and isinstance(response_data, list):
-                for item in response_data:
+                # Results come back in request order, so map them by position
+                # rather than requesting and parsing externalIds for every paper
+                for clean_id, item in zip(clean_ids, response_data):
                     if item is not None:  # Some papers might not be found
-                        # Extract arXiv ID from external IDs
-                        arxiv_id = None
-                        if "externalIds" in item and item["externalIds"]:
-                            arxiv_id = item["externalIds"].get("ArXiv")
-                        
                         paper = SemanticScholarPaper(
                             paper_id=item.get("paperId", ""),
-                            arxiv_id=arxiv_id,
+                            arxiv_id=clean_id,
                             title=item.get("title", ""),
                             citation_count=item.get("citationCount", 0)
                         )
@@ -445,60 +695,117 @@ class SemanticScholarClient:
         except Exception as e:
             logger.error(f"Failed to batch get citations: {e}")
             raise
+    
+    def _get_batch_citation_counts(self, batch: List[str], batch_number: int) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Get citation counts for one batch, falling back to individual requests if the batch fails
+        
+        Returns:
+            Tuple of (citation counts found, arXiv IDs whose lookup failed)
+        """
+        citation_counts = {}
+        failed_ids = []
+        
+        try:
+            papers = self.batch_get_citations(batch)
+            for paper in papers:
+                if paper.arxiv_id:
+                    citation_counts[paper.arxiv_id] = paper.citation_count
+        except Exception as e:
+            logger.error(f"Failed to get citations for batch {batch_number}: {e}")
+            # Fall back to individual requests for this batch
+            for arxiv_id in batch:
+                try:
+                    paper = self.get_paper_citations(arxiv_id)
+                    if paper and paper.arxiv_id:
+                        citation_counts[paper.arxiv_id] = paper.citation_count
+                except Exception as individual_error:
+                    logger.warning(f"Failed to get citations for {arxiv_id}: {individual_error}")
+                    failed_ids.append(arxiv_id)
+        
+        return citation_counts, failed_ids
+    
+    def get_citation_counts(self, arxiv_ids: List[str]) -> Dict[str, int]:
+        """
+        Get citation counts for any number of papers, batching requests
+        
+        Args:
+            arxiv_ids: List of arXiv IDs
+            
+        Returns:
+            Dictionary mapping each requested arXiv ID to its citation count (0 if not found)
+        """
+        # Look each paper up once under its version-less ID, whatever form or
+        # how many times it was requested in
+        raw_to_clean = {arxiv_id: _strip_version(arxiv_id) for arxiv_id in arxiv_ids}
+        unique_ids = list(dict.fromkeys(raw_to_clean.values()))
+        
+        citation_counts = {}
+        
+        # Counts seen in the last citation_cache_days are reused from disk
+        if self.citation_cache is not None:
+            citation_counts.update(self.citation_cache.get_many(unique_ids))
+        missing_ids = [arxiv_id for arxiv_id in unique_ids if arxiv_id not in citation_counts]
+        if citation_counts:
+            logger.info(f"Reusing {len(citation_counts)} cached citation counts, fetching {len(missing_ids)}")
+        
+        fetched_counts = {}
+        
+        # Process in batches of 500
+        batch_size = 500
+        batches = [missing_ids[i:i + batch_size] for i in range(0, len(missing_ids), batch_size)]
+        
+        # Sequential: the rate limit allows one request per interval, so
+        # concurrent batches would only queue on the token bucket
+        for batch_num, batch in enumerate(batches, 1):
+            batch_counts, failed_ids = self._get_batch_citation_counts(batch, batch_num)
+            fetched_counts.update(batch_counts)
+            citation_counts.update(dict.fromkeys(failed_ids, 0))
+        
+        # Failed lookups stay out of the cache so they are retried next run
+        if fetched_counts and self.citation_cache is not None:
+            self.citation_cache.set_many(fetched_counts, ttl_seconds=settings.citation_cache_days * 86400)
+        citation_counts.update(fetched_counts)
+        
+        return {raw_id: citation_counts.get(clean_id, 0) for raw_id, clean_id in raw_to_clean.items()}
 
 
 # Convenience functions for easier usage
-def get_arxiv_papers_for_date(target_date: date, category: str = None) -> List[ArxivPaper]:
+def get_arxiv_papers_for_date(target_date: date, category: str = None, client: Optional[ArxivClient] = None) -> List[ArxivPaper]:
     """
     Convenience function to get arXiv papers for a specific date
     
     Args:
         target_date: The date to search for
         category: Optional category filter
+        client: Optional client to reuse across calls (a temporary one is used otherwise)
         
     Returns:
         List of ArxivPaper objects
     """
-    client = ArxivClient()
-    return client.search_papers_by_date(target_date, category)
+    if client is not None:
+        return client.search_papers_by_date(target_date, category)
+    
+    with ArxivClient() as client:
+        return client.search_papers_by_date(target_date, category)
 
 
-def get_citation_counts_for_papers(arxiv_ids: List[str]) -> Dict[str, int]:
+def get_citation_counts_for_papers(arxiv_ids: List[str], client: Optional[SemanticScholarClient] = None) -> Dict[str, int]:
     """
     Convenience function to get citation counts for multiple papers
     
     Args:
         arxiv_ids: List of arXiv IDs
+        client: Optional client to reuse across calls (a temporary one is used otherwise)
         
     Returns:
         Dictionary mapping arXiv ID to citation count
     """
-    client = SemanticScholarClient()
-    citation_counts = {}
-    
-    # Process in batches of 500
-    batch_size = 500
-    for i in range(0, len(arxiv_ids), batch_size):
-        batch = arxiv_ids[i:i + batch_size]
-        
-        try:
-            papers = client.batch_get_citations(batch)
-            for paper in papers:
-                if paper.arxiv_id:
-                    citation_counts[paper.arxiv_id] = paper.citation_count
-        except Exception as e:
-            logger.error(f"Failed to get citations for batch {i//batch_size + 1}: {e}")
-            # Fall back to individual requests for this batch
-            for arxiv_id in batch:
-                try:
-                    paper = client.get_paper_citations(arxiv_id)
-                    if paper and paper.arxiv_id:
-                        citation_counts[paper.arxiv_id] = paper.citation_count
-                except Exception as individual_error:
-                    logger.warning(f"Failed to get citations for {arxiv_id}: {individual_error}")
-                    citation_counts[arxiv_id] = 0
+    if client is not None:
+        return client.get_citation_counts(arxiv_ids)
     
-    return citation_counts
+    with SemanticScholarClient() as client:
+        return client.get_citation_counts(arxiv_ids)
 
 
 def convert_arxiv_to_paper_dict(arxiv_paper: ArxivPaper) -> Dict[str, Any]:
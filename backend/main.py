@@ -1,13 +1,22 @@
-from fastapi import FastAPI, HTTPException, APIRouter, Depends, Query
+from fastapi import FastAPI, HTTPException, APIRouter, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import date, datetime
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time, timedelta
+import threading
+import logging
 import uvicorn
 
 from database import get_db, test_connection, DailyFeaturedPaper, Paper
-from paper_service import PaperService
+from paper_service import get_paper_service
+from config import settings
+
+logger = logging.getLogger(__name__)
 
 
 # Pydantic Response Models
@@ -21,7 +30,8 @@ class Author(BaseModel):
 
 class PaperResponse(BaseModel):
     """Paper response model with proper field aliases"""
-    id: str
+    # ORM papers have no separate id; their arXiv ID is used instead
+    id: str = Field(..., validation_alias=AliasChoices("id", "arxiv_id"))
     arxivId: str = Field(..., alias="arxiv_id")
     title: str
     abstract: str
@@ -37,22 +47,33 @@ class PaperResponse(BaseModel):
         from_attributes = True
         populate_by_name = True
 
+    @field_validator("authors", mode="before")
+    @classmethod
+    def _coerce_authors(cls, authors):
+        """Accept authors as {"name": ...} objects (as stored) or plain names"""
+        # Lists are uniform, so check the first entry only. Objects are left
+        # to pydantic-core; only plain names need wrapping.
+        if authors and isinstance(authors[0], str):
+            return [{"name": name} for name in authors]
+        return authors or []
+
+    @field_validator("submittedDate", mode="before")
+    @classmethod
+    def _coerce_submitted_date(cls, submitted_date):
+        """Accept dates as well as ISO date strings"""
+        if isinstance(submitted_date, date):
+            return submitted_date.isoformat()
+        return submitted_date
+
     @classmethod
     def from_dict(cls, paper_dict: dict):
         """Create PaperResponse from dictionary representation"""
-        # Convert authors to Author objects if they are dicts
-        authors = paper_dict.get("authors", [])
-        if authors and isinstance(authors[0], dict):
-            authors = [Author(name=author.get("name", "")) for author in authors]
-        elif authors and isinstance(authors[0], str):
-            authors = [Author(name=name) for name in authors]
-        
         return cls(
             id=str(paper_dict.get("id", "")),
             arxiv_id=paper_dict.get("arxiv_id", ""),
             title=paper_dict.get("title", ""),
             abstract=paper_dict.get("abstract", ""),
-            authors=authors,
+            authors=paper_dict.get("authors", []),
             categories=paper_dict.get("categories", []),
             primary_category=paper_dict.get("primary_category", ""),
             submitted_date=paper_dict.get("submitted_date", ""),
@@ -115,10 +136,88 @@ class HistoryResponse(BaseModel):
         from_attributes = True
 
 
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes with pydantic-core
+    
+    Returning a Response skips FastAPI re-validating the model against
+    response_model and walking it again with jsonable_encoder. The output is
+    unchanged; response_model is still used for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(by_alias=True), media_type="application/json")
+
+
+def daily_json_response(request: Request, model: BaseModel, etag: str) -> Response:
+    """
+    Like json_response(), for a selection that stays the same until midnight
+    
+    Lets browsers and proxies cache the response for the rest of the day, and
+    answers a matching If-None-Match with 304 Not Modified and no body.
+    
+    Args:
+        request: The incoming request
+        model: Response model to serialize
+        etag: Weak ETag identifying the selection
+        
+    Returns:
+        Response with Cache-Control and ETag headers
+    """
+    seconds_left = (datetime.combine(date.today() + timedelta(days=1), time.min) - datetime.now()).seconds
+    headers = {"Cache-Control": f"public, max-age={seconds_left}", "ETag": etag}
+    
+    # Weak comparison: ignore W/ prefixes on either side
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers=headers)
+    
+    response = json_response(model)
+    response.headers.update(headers)
+    return response
+
+
+# Set on shutdown to stop the cache warmup thread
+_warmup_stop = threading.Event()
+
+
+def _warm_daily_cache(categories: List[Optional[str]]):
+    """Compute today's selections before users ask for them, then again just after each midnight"""
+    while not _warmup_stop.is_set():
+        today = date.today()
+        try:
+            paper_service.warm_cache(today, categories)
+        except Exception as e:
+            logger.error(f"Cache warmup failed for {today}: {e}")
+        
+        next_run = datetime.combine(today + timedelta(days=1), time(0, 5))
+        _warmup_stop.wait(max((next_run - datetime.now()).total_seconds(), 0))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the cache warmup thread for the app's lifetime"""
+    categories = [
+        None if category == "all" else category
+        for category in (c.strip() for c in settings.warmup_categories.split(","))
+        if category
+    ]
+    if categories:
+        # A daemon thread, so the blocking fetches never hold up the event loop or shutdown
+        threading.Thread(target=_warm_daily_cache, args=(categories,), name="cache-warmup", daemon=True).start()
+    
+    yield
+    
+    _warmup_stop.set()
+
+
 app = FastAPI(
     title="Paper Birthdays API",
     description="API for discovering historically significant academic papers published on this day",
-    version="1.0.0"
+    version="1.0.0",
+    # Endpoints that return plain dicts are serialized with orjson
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware for Next.js frontend
@@ -131,14 +230,16 @@ app.add_middleware(
 )
 
 # Initialize paper service
-paper_service = PaperService()
+paper_service = get_paper_service()
 
 # Create API router
 router = APIRouter(prefix="/api/paper", tags=["papers"])
 
 
+# Handlers that call the synchronous service or database are plain functions so
+# FastAPI runs them in its threadpool instead of blocking the event loop
 @router.get("/today", response_model=TodayPaperResponse)
-async def get_today_paper(db: Session = Depends(get_db)):
+def get_today_paper(request: Request):
     """Get today's featured paper for the main page"""
     try:
         today = date.today()
@@ -152,10 +253,10 @@ async def get_today_paper(db: Session = Depends(get_db)):
         
         paper_response = PaperResponse.from_dict(paper_dict)
         
-        return TodayPaperResponse(
+        return daily_json_response(request, TodayPaperResponse(
             paper=paper_response,
             featured_date=today.isoformat()
-        )
+        ), etag=f'W/"{today.isoformat()}-{paper_response.arxivId}"')
         
     except HTTPException:
         raise
@@ -167,7 +268,7 @@ async def get_today_paper(db: Session = Depends(get_db)):
 
 
 @router.get("/category/{category}", response_model=CategoryPaperResponse)
-async def get_category_paper(category: str, db: Session = Depends(get_db)):
+def get_category_paper(category: str, request: Request):
     """Get today's featured paper for a specific category"""
     try:
         today = date.today()
@@ -181,11 +282,11 @@ async def get_category_paper(category: str, db: Session = Depends(get_db)):
         
         paper_response = PaperResponse.from_dict(paper_dict)
         
-        return CategoryPaperResponse(
+        return daily_json_response(request, CategoryPaperResponse(
             paper=paper_response,
             category=category,
             featured_date=today.isoformat()
-        )
+        ), etag=f'W/"{today.isoformat()}-{category}-{paper_response.arxivId}"')
         
     except HTTPException:
         raise
@@ -197,7 +298,7 @@ async def get_category_paper(category: str, db: Session = Depends(get_db)):
 
 
 @router.get("/history", response_model=HistoryResponse)
-async def get_paper_history(
+def get_paper_history(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=50, description="Items per page"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -208,55 +309,58 @@ async def get_paper_history(
         # Calculate offset
         offset = (page - 1) * limit
         
-        # Build base query
-        query = db.query(DailyFeaturedPaper).join(Paper)
+        # Build base query; every featured row references a paper, so no join is needed to filter
+        query = db.query(DailyFeaturedPaper)
         
         # Add category filter if specified
         if category:
             query = query.filter(DailyFeaturedPaper.category == category)
         
-        # Get total count
-        total = query.count()
-        
-        # Get paginated results, ordered by feature_date desc
+        # Get paginated results, ordered by feature_date desc, joining in only
+        # the paper columns the response needs; author names are extracted by
+        # Postgres so the full author objects are never sent or decoded. One
+        # extra row is fetched to tell whether there is a next page.
         featured_papers = (
-            query.order_by(DailyFeaturedPaper.feature_date.desc())
+            query.join(DailyFeaturedPaper.paper)
+            .with_entities(
+                DailyFeaturedPaper.feature_date,
+                DailyFeaturedPaper.category,
+                Paper.arxiv_id,
+                Paper.title,
+                Paper.abstract,
+                func.jsonb_path_query_array(Paper.authors, '$[*].name', type_=JSONB).label("authors"),
+                Paper.categories,
+                Paper.primary_category,
+                Paper.submitted_date,
+                Paper.citation_count,
+                Paper.pdf_url,
+                Paper.abstract_url,
+            )
+            .order_by(DailyFeaturedPaper.feature_date.desc())
             .offset(offset)
-            .limit(limit)
+            .limit(limit + 1)
             .all()
         )
+        has_next = len(featured_papers) > limit
+        featured_papers = featured_papers[:limit]
+        
+        if has_next or (offset and not featured_papers):
+            # Get total count with a plain COUNT rather than counting a wrapped subquery
+            total = query.with_entities(func.count(DailyFeaturedPaper.id)).scalar()
+        else:
+            # Last page: the total follows from the rows already fetched
+            total = offset + len(featured_papers)
         
         # Convert to response format
-        history_items = []
-        for featured_paper in featured_papers:
-            paper = featured_paper.paper
-            
-            # Convert paper to dict format for PaperResponse.from_dict
-            paper_dict = {
-                "id": paper.id,
-                "arxiv_id": paper.arxiv_id,
-                "title": paper.title,
-                "abstract": paper.abstract,
-                "authors": paper.authors,  # Already in JSON format
-                "categories": paper.categories,
-                "primary_category": paper.primary_category,
-                "submitted_date": paper.submitted_date.isoformat(),
-                "citation_count": paper.citation_count,
-                "pdf_url": paper.pdf_url,
-                "abstract_url": paper.abstract_url,
-            }
-            
-            paper_response = PaperResponse.from_dict(paper_dict)
-            
-            history_item = HistoryPaperItem(
-                paper=paper_response,
+        history_items = [
+            HistoryPaperItem(
+                # Validated straight from the row, without an intermediate dict
+                paper=PaperResponse.model_validate(featured_paper),
                 featured_date=featured_paper.feature_date.isoformat(),
                 category=featured_paper.category
             )
-            history_items.append(history_item)
-        
-        # Calculate pagination info
-        has_next = (offset + limit) < total
+            for featured_paper in featured_papers
+        ]
         
         pagination = Pagination(
             page=page,
@@ -265,10 +369,7 @@ async def get_paper_history(
             has_next=has_next
         )
         
-        return HistoryResponse(
-            papers=history_items,
-            pagination=pagination
-        )
+        return json_response(HistoryResponse(papers=history_items, pagination=pagination))
         
     except HTTPException:
         raise
@@ -284,7 +385,7 @@ app.include_router(router)
 
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint that verifies database connectivity"""
     db_status = test_connection()
     
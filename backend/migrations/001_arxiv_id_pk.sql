@@ -0,0 +1,58 @@
+-- Migrate an existing database to the arxiv_id-keyed schema.
+--
+-- papers.arxiv_id becomes the primary key (the surrogate papers.id is
+-- dropped) and daily_featured_papers references it through paper_arxiv_id
+-- instead of paper_id. papers.authors moves from json to jsonb so it can be
+-- GIN-indexed and queried with jsonb_path_query_array. Fresh databases created by database.create_tables()
+-- already have this layout and do not need this script.
+--
+-- Run once with:  psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f 001_arxiv_id_pk.sql
+
+BEGIN;
+
+-- daily_featured_papers.paper_id -> paper_arxiv_id
+ALTER TABLE daily_featured_papers ADD COLUMN paper_arxiv_id VARCHAR(50);
+
+UPDATE daily_featured_papers
+SET paper_arxiv_id = papers.arxiv_id
+FROM papers
+WHERE papers.id = daily_featured_papers.paper_id;
+
+ALTER TABLE daily_featured_papers ALTER COLUMN paper_arxiv_id SET NOT NULL;
+
+-- Dropping paper_id also drops its foreign key and the unique constraint on
+-- (feature_date, category, paper_id).
+ALTER TABLE daily_featured_papers DROP COLUMN paper_id;
+
+-- papers.id -> papers.arxiv_id as primary key
+ALTER TABLE papers DROP CONSTRAINT papers_pkey;
+ALTER TABLE papers DROP COLUMN id;
+ALTER TABLE papers DROP CONSTRAINT IF EXISTS papers_arxiv_id_key;
+ALTER TABLE papers ADD PRIMARY KEY (arxiv_id);
+
+ALTER TABLE daily_featured_papers
+    ADD CONSTRAINT daily_featured_papers_paper_arxiv_id_fkey
+    FOREIGN KEY (paper_arxiv_id) REFERENCES papers (arxiv_id);
+
+ALTER TABLE daily_featured_papers
+    ADD CONSTRAINT _feature_date_category_paper_uc
+    UNIQUE (feature_date, category, paper_arxiv_id);
+
+-- papers.authors json -> jsonb
+ALTER TABLE papers ALTER COLUMN authors TYPE jsonb USING authors::jsonb;
+CREATE INDEX IF NOT EXISTS idx_papers_authors_gin ON papers USING GIN (authors);
+
+COMMIT;
+
+-- Composite index serving "latest featured paper for a category" lookups.
+-- CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so
+-- these statements stay outside BEGIN/COMMIT and do not lock writes.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_daily_featured_category_date
+    ON daily_featured_papers (category, feature_date DESC);
+DROP INDEX CONCURRENTLY IF EXISTS idx_daily_featured_category;
+
+-- Covering index for fetch-history lookups, replacing the two it supersedes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fetch_history_lookup
+    ON fetch_history (fetch_date, status, category) INCLUDE (id);
+DROP INDEX CONCURRENTLY IF EXISTS idx_fetch_history_date;
+DROP INDEX CONCURRENTLY IF EXISTS idx_fetch_history_date_cat_status;
@@ -1,34 +1,113 @@
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Any
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Any, Set, Tuple
+import heapq
 import logging
 import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+import orjson
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from database import (
     get_db, Paper, DailyFeaturedPaper, FetchHistory, 
-    create_paper, get_paper_by_arxiv_id, SessionLocal
+    upsert_paper_ids, SessionLocal
 )
 from external_apis import (
     ArxivClient, SemanticScholarClient, 
-    convert_arxiv_to_paper_dict, get_arxiv_papers_for_date,
-    get_citation_counts_for_papers
+    convert_arxiv_to_paper_dict
 )
 from config import settings
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# In-memory cache with TTL support
-_paper_cache: Dict[str, Dict[str, Any]] = {}
+# In-memory LRU cache with TTL support, shared by all threads of the process.
+# Ordered oldest-used first and bounded by settings.cache_max_entries. Expiry
+# times are time.monotonic() values, unaffected by wall-clock changes.
+_paper_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.RLock()
+
+# Per-key locks so that only one thread of the process fills a cache entry,
+# each with the number of threads holding or waiting for it
+_fill_locks: Dict[str, List[Any]] = {}
+_fill_locks_guard = threading.Lock()
+
+# Cached in place of a paper when none could be selected (negative caching)
+_NO_PAPER_FOUND = object()
+
+# Historical dates fetched from arXiv at once; the client's rate limiter still
+# spaces out the requests, but their round-trips overlap
+DATE_FETCH_WORKERS = 4
+
+# Prefixes for keys in the shared Redis cache
+_REDIS_PAPER_PREFIX = "paper:"
+_REDIS_LOCK_PREFIX = "paper-lock:"
+
+
+@lru_cache(maxsize=None)
+def _get_redis():
+    """
+    Get the Redis client backing the cache shared by all worker processes
+    
+    Returns:
+        Redis client, or None if REDIS_URL is unset or the redis package is missing
+    """
+    if not settings.redis_url:
+        return None
+    
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using the in-process cache only")
+        return None
+    
+    # Short timeouts: an unreachable Redis should degrade to the local cache,
+    # not stall requests
+    return redis.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_timeout_seconds,
+        socket_connect_timeout=settings.redis_timeout_seconds,
+        health_check_interval=30
+    )
+
+
+@lru_cache(maxsize=512)
+def _historical_dates(target_date: date) -> Tuple[date, ...]:
+    """Same month/day in each of the 10 years before target_date (memoized; pure in target_date)"""
+    dates = []
+    current_year = target_date.year
+    
+    for i in range(10):
+        year = current_year - i - 1  # Start from previous year
+        try:
+            # Handle leap year edge case for Feb 29
+            historical_date = date(year, target_date.month, target_date.day)
+            dates.append(historical_date)
+        except ValueError:
+            # Feb 29 in non-leap year - use Feb 28 instead
+            if target_date.month == 2 and target_date.day == 29:
+                historical_date = date(year, 2, 28)
+                dates.append(historical_date)
+            else:
+                logger.warning(f"Could not create date for {year}-{target_date.month}-{target_date.day}")
+    
+    return tuple(dates)
 
 
 class PaperService:
     """Core service for paper selection algorithm and caching"""
     
     def __init__(self):
+        # Clients hold pooled HTTP connections, so reuse them for every fetch
         self.arxiv_client = ArxivClient()
         self.semantic_scholar_client = SemanticScholarClient()
+        # Enriched all-category papers per historical date, filled by prefetch_papers()
+        self._prefetched_papers: Dict[date, List[Dict[str, Any]]] = {}
     
     def get_daily_paper(self, target_date: date, category: str = None) -> Optional[Dict[str, Any]]:
         """
@@ -46,44 +125,61 @@ class PaperService:
         try:
             # 1. Check cache first
             cached_paper = self._get_cached_paper(target_date, category)
+            if cached_paper is _NO_PAPER_FOUND:
+                logger.info(f"Returning cached empty result for {target_date}, category: {category}")
+                return None
             if cached_paper:
                 logger.info(f"Returning cached paper for {target_date}, category: {category}")
                 return cached_paper
             
-            # 2. Calculate date range (last 10 years)
-            historical_dates = self.get_last_10_years_dates(target_date)
-            logger.info(f"Searching papers from {len(historical_dates)} historical dates")
-            
-            # 3. Fetch and enrich papers from arXiv and Semantic Scholar
-            enriched_papers = self.fetch_and_enrich_papers(historical_dates, category)
-            
-            if not enriched_papers:
-                logger.warning(f"No papers found for {target_date}, category: {category}")
-                self._log_fetch_history(target_date, category, 0, "failed", "No papers found")
-                return None
-            
-            # 4. Get top 10 by citation count
-            top_papers = self.select_top_papers(enriched_papers, count=10)
-            
-            if not top_papers:
-                logger.warning(f"No top papers selected for {target_date}, category: {category}")
-                self._log_fetch_history(target_date, category, len(enriched_papers), "failed", "No top papers selected")
-                return None
-            
-            # 5. Randomly select one from top 10
-            selected_paper = random.choice(top_papers)
-            logger.info(f"Selected paper: {selected_paper['title'][:100]}... (citations: {selected_paper['citation_count']})")
-            
-            # 6. Store daily selection and rankings
-            self.store_daily_selection(target_date, category, top_papers, selected_paper)
-            
-            # 7. Cache the selection
-            self._cache_paper(target_date, category, selected_paper)
-            
-            # 8. Log successful fetch
-            self._log_fetch_history(target_date, category, len(enriched_papers), "success", None)
-            
-            return selected_paper
+            # Let a single worker fetch on a miss while the others wait for its result
+            with self._cache_fill_lock(target_date, category):
+                cached_paper = self._get_cached_paper(target_date, category)
+                if cached_paper is _NO_PAPER_FOUND:
+                    return None
+                if cached_paper:
+                    logger.info(f"Returning paper cached by another worker for {target_date}, category: {category}")
+                    return cached_paper
+                
+                # 2. Calculate date range (last 10 years)
+                historical_dates = self.get_last_10_years_dates(target_date)
+                logger.info(f"Searching papers from {len(historical_dates)} historical dates")
+                
+                # 3. Fetch and enrich papers from arXiv and Semantic Scholar
+                enriched_papers, complete = self._fetch_and_enrich_papers(historical_dates, category)
+                
+                if not enriched_papers and not complete:
+                    # Not cached: an arXiv outage must not read as "no paper" until the entry expires
+                    raise Exception(f"arXiv search failed for some dates of {target_date}, category: {category}")
+                
+                if not enriched_papers:
+                    logger.warning(f"No papers found for {target_date}, category: {category}")
+                    self._log_fetch_history(target_date, category, 0, "failed", "No papers found")
+                    self._cache_paper(target_date, category, _NO_PAPER_FOUND)
+                    return None
+                
+                # 4. Get top 10 by citation count
+                top_papers = self.select_top_papers(enriched_papers, count=10)
+                
+                if not top_papers:
+                    logger.warning(f"No top papers selected for {target_date}, category: {category}")
+                    self._log_fetch_history(target_date, category, len(enriched_papers), "failed", "No top papers selected")
+                    self._cache_paper(target_date, category, _NO_PAPER_FOUND)
+                    return None
+                
+                # 5. Randomly select one from top 10
+                selected_paper = top_papers[random.randrange(len(top_papers))]
+                logger.info(f"Selected paper: {selected_paper['title'][:100]}... (citations: {selected_paper['citation_count']})")
+                
+                # 6. Store daily selection and rankings, logging the successful fetch
+                # in the same transaction
+                self.store_daily_selection(target_date, category, top_papers, selected_paper,
+                                           papers_fetched=len(enriched_papers))
+                
+                # 7. Cache the selection
+                self._cache_paper(target_date, category, selected_paper)
+                
+                return selected_paper
             
         except Exception as e:
             logger.error(f"Error getting daily paper for {target_date}, category {category}: {e}")
@@ -100,23 +196,7 @@ class PaperService:
         Returns:
             List of dates from the last 10 years
         """
-        dates = []
-        current_year = target_date.year
-        
-        for i in range(10):
-            year = current_year - i - 1  # Start from previous year
-            try:
-                # Handle leap year edge case for Feb 29
-                historical_date = date(year, target_date.month, target_date.day)
-                dates.append(historical_date)
-            except ValueError:
-                # Feb 29 in non-leap year - use Feb 28 instead
-                if target_date.month == 2 and target_date.day == 29:
-                    historical_date = date(year, 2, 28)
-                    dates.append(historical_date)
-                else:
-                    logger.warning(f"Could not create date for {year}-{target_date.month}-{target_date.day}")
-        
+        dates = list(_historical_dates(target_date))
         logger.info(f"Generated {len(dates)} historical dates: {[d.strftime('%Y-%m-%d') for d in dates]}")
         return dates
     
@@ -131,51 +211,190 @@ class PaperService:
         Returns:
             List of enriched paper dictionaries
         """
+        return self._fetch_and_enrich_papers(dates, category)[0]
+    
+    def _fetch_and_enrich_papers(self, dates: List[date], category: str = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch papers from arXiv for given dates and enrich with citation data,
+        reporting whether every date could be searched
+        
+        Args:
+            dates: List of dates to search
+            category: Optional category filter
+            
+        Returns:
+            Tuple of (enriched paper dictionaries, False if any date's search failed)
+        """
         all_papers = []
-        arxiv_id_to_paper = {}
+        seen_arxiv_ids = set()
+        dates_to_fetch = []
+        
+        def add_papers(paper_dicts: List[Dict[str, Any]]):
+            # Keep the first occurrence of each paper
+            seen_add, append = seen_arxiv_ids.add, all_papers.append
+            for paper_dict in paper_dicts:
+                arxiv_id = paper_dict['arxiv_id']
+                if arxiv_id not in seen_arxiv_ids:
+                    seen_add(arxiv_id)
+                    append(paper_dict)
         
-        # Fetch papers from arXiv for each date
         for search_date in dates:
-            try:
-                logger.info(f"Fetching papers for {search_date}")
-                arxiv_papers = get_arxiv_papers_for_date(search_date, category)
-                
-                for arxiv_paper in arxiv_papers:
-                    # Convert to dictionary format and avoid duplicates
-                    if arxiv_paper.arxiv_id not in arxiv_id_to_paper:
-                        paper_dict = convert_arxiv_to_paper_dict(arxiv_paper)
-                        arxiv_id_to_paper[arxiv_paper.arxiv_id] = paper_dict
-                        all_papers.append(paper_dict)
-                
-                logger.info(f"Found {len(arxiv_papers)} papers for {search_date}")
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch papers for {search_date}: {e}")
+            prefetched_papers = self._prefetched_papers.get(search_date)
+            if prefetched_papers is None:
+                dates_to_fetch.append(search_date)
                 continue
+            
+            # Already fetched and enriched across all categories - filter in memory
+            if category:
+                prefetched_papers = [p for p in prefetched_papers if category in p['categories']]
+            add_papers(prefetched_papers)
+            logger.info(f"Using {len(prefetched_papers)} prefetched papers for {search_date}")
+        
+        fetched_papers, incomplete_dates = self._fetch_and_enrich_by_date(dates_to_fetch, category)
+        for search_date in dates_to_fetch:
+            add_papers(fetched_papers.get(search_date, []))
+        
+        # Dates whose search failed are missing from the fetched results
+        complete = len(fetched_papers) == len(dates_to_fetch) and not incomplete_dates
         
         if not all_papers:
             logger.warning("No papers found from arXiv")
-            return []
+            return [], complete
         
         logger.info(f"Total unique papers from arXiv: {len(all_papers)}")
+        return all_papers, complete
+    
+    def _fetch_and_enrich_by_date(self, dates: List[date], category: str = None) -> Tuple[Dict[date, List[Dict[str, Any]]], Set[date]]:
+        """
+        Fetch papers from arXiv for several dates concurrently, enriching each
+        date's papers with citation data in the background as soon as they
+        arrive, so arXiv and Semantic Scholar latencies overlap instead of adding up
         
-        # Enrich with citation data from Semantic Scholar
+        Args:
+            dates: List of dates to search
+            category: Optional category filter
+            
+        Returns:
+            Tuple of (dictionary mapping each successfully fetched date to its
+            enriched papers, set of those dates whose later result pages failed)
+        """
+        papers_by_date = {}
+        incomplete_dates = set()
+        
+        # A single worker keeps Semantic Scholar requests sequential; their rate
+        # limit is enforced by the client either way
+        with ThreadPoolExecutor(max_workers=1) as enrich_executor, \
+                ThreadPoolExecutor(max_workers=DATE_FETCH_WORKERS) as fetch_executor:
+            enrichments = []
+            fetches = {
+                fetch_executor.submit(self.arxiv_client.search_papers_by_date_with_status, search_date, category,
+                                      raise_on_failure=True): search_date
+                for search_date in dates
+            }
+            logger.info(f"Fetching papers for {len(fetches)} dates")
+            
+            for fetch in as_completed(fetches):
+                search_date = fetches[fetch]
+                try:
+                    arxiv_papers, date_complete = fetch.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch papers for {search_date}: {e}")
+                    continue
+                
+                if not date_complete:
+                    incomplete_dates.add(search_date)
+                
+                paper_dicts = [convert_arxiv_to_paper_dict(arxiv_paper) for arxiv_paper in arxiv_papers]
+                papers_by_date[search_date] = paper_dicts
+                logger.info(f"Found {len(arxiv_papers)} papers for {search_date}")
+                
+                if paper_dicts:
+                    enrichments.append(enrich_executor.submit(self._enrich_with_citations, paper_dicts))
+            
+            for enrichment in enrichments:
+                enrichment.result()
+        
+        return papers_by_date, incomplete_dates
+    
+    def _enrich_with_citations(self, papers: List[Dict[str, Any]]):
+        """Set citation_count on papers in place from Semantic Scholar"""
         try:
-            arxiv_ids = [paper['arxiv_id'] for paper in all_papers]
-            citation_counts = get_citation_counts_for_papers(arxiv_ids)
+            arxiv_ids = [paper['arxiv_id'] for paper in papers]
+            citation_counts = self.semantic_scholar_client.get_citation_counts(arxiv_ids)
             
             # Update papers with citation counts
-            for paper in all_papers:
-                arxiv_id = paper['arxiv_id']
-                paper['citation_count'] = citation_counts.get(arxiv_id, 0)
+            for paper in papers:
+                paper['citation_count'] = citation_counts.get(paper['arxiv_id'], 0)
             
-            logger.info(f"Successfully enriched {len(all_papers)} papers with citation data")
+            logger.info(f"Successfully enriched {len(papers)} papers with citation data")
             
         except Exception as e:
             logger.error(f"Failed to enrich papers with citation data: {e}")
             # Continue with papers but without citation data
+    
+    def prefetch_papers(self, dates: List[date]) -> int:
+        """
+        Fetch and enrich papers across all categories once per date, so that
+        subsequent category selections for these dates filter in memory instead
+        of issuing their own arXiv and Semantic Scholar requests
+        
+        Args:
+            dates: List of dates to prefetch
+            
+        Returns:
+            Number of papers prefetched
+        """
+        prefetched_count = 0
+        dates_to_fetch = [d for d in dates if d not in self._prefetched_papers]
+        
+        papers_by_date, incomplete_dates = self._fetch_and_enrich_by_date(dates_to_fetch)
+        for search_date, papers in papers_by_date.items():
+            # Dates without results, or with missing pages, are left to be
+            # queried per category
+            if papers and search_date not in incomplete_dates:
+                self._prefetched_papers[search_date] = papers
+                prefetched_count += len(papers)
+        
+        logger.info(f"Prefetched {prefetched_count} papers across {len(dates)} dates")
+        return prefetched_count
+    
+    def clear_prefetched_papers(self):
+        """Drop papers held by prefetch_papers()"""
+        self._prefetched_papers.clear()
+    
+    def warm_cache(self, target_date: date, categories: List[Optional[str]]) -> int:
+        """
+        Compute and cache the daily selections for several categories ahead of
+        the first requests for them
+        
+        Args:
+            target_date: The date to select papers for
+            categories: Categories to warm (None for the main page)
+            
+        Returns:
+            Number of categories whose selection is now cached
+        """
+        warmed_count = 0
+        
+        # Every category searches the same historical dates, so fetch each date once
+        if len(categories) > 1:
+            try:
+                self.prefetch_papers(self.get_last_10_years_dates(target_date))
+            except Exception as e:
+                logger.warning(f"Prefetch failed, categories will be fetched individually: {e}")
+        
+        try:
+            for category in categories:
+                try:
+                    self.get_daily_paper(target_date, category)
+                    warmed_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to warm cache for {target_date}, category {category}: {e}")
+        finally:
+            self.clear_prefetched_papers()
         
-        return all_papers
+        logger.info(f"Warmed cache for {warmed_count}/{len(categories)} categories on {target_date}")
+        return warmed_count
     
     def select_top_papers(self, papers: List[Dict[str, Any]], count: int = 10) -> List[Dict[str, Any]]:
         """
@@ -188,22 +407,22 @@ class PaperService:
         Returns:
             List of top papers sorted by citation count descending
         """
-        # Sort by citation count descending, then by title for deterministic ordering
-        sorted_papers = sorted(
-            papers, 
-            key=lambda p: (p.get('citation_count', 0), p.get('title', '')), 
-            reverse=True
+        # Rank by citation count descending, then by title for deterministic ordering;
+        # only the top few are kept, so avoid sorting the whole list
+        top_papers = heapq.nlargest(
+            count,
+            papers,
+            key=lambda p: (p.get('citation_count', 0), p.get('title', ''))
         )
         
-        top_papers = sorted_papers[:count]
-        
         logger.info(f"Selected top {len(top_papers)} papers from {len(papers)} total papers")
         if top_papers:
             logger.info(f"Citation counts range: {top_papers[0].get('citation_count', 0)} to {top_papers[-1].get('citation_count', 0)}")
         
         return top_papers
     
-    def store_daily_selection(self, target_date: date, category: str, top_papers: List[Dict[str, Any]], selected_paper: Dict[str, Any]):
+    def store_daily_selection(self, target_date: date, category: str, top_papers: List[Dict[str, Any]], selected_paper: Dict[str, Any],
+                              papers_fetched: Optional[int] = None):
         """
         Store daily paper selection and rankings in database
         
@@ -212,34 +431,12 @@ class PaperService:
             category: Category filter used (or None)
             top_papers: List of top papers ranked 1-10
             selected_paper: The randomly selected paper from top_papers
+            papers_fetched: If given, also log a successful fetch of this many papers
         """
         db = SessionLocal()
         try:
-            # Store all top papers in database first
-            stored_papers = {}
-            
-            for paper_dict in top_papers:
-                # Check if paper already exists
-                existing_paper = get_paper_by_arxiv_id(db, paper_dict['arxiv_id'])
-                
-                if existing_paper:
-                    # Update citation count if it's higher
-                    if paper_dict.get('citation_count', 0) > existing_paper.citation_count:
-                        existing_paper.citation_count = paper_dict['citation_count']
-                        db.commit()
-                        db.refresh(existing_paper)
-                    stored_papers[paper_dict['arxiv_id']] = existing_paper
-                else:
-                    # Create new paper
-                    try:
-                        new_paper = create_paper(db, paper_dict)
-                        stored_papers[paper_dict['arxiv_id']] = new_paper
-                    except IntegrityError:
-                        # Handle race condition where paper was created by another process
-                        db.rollback()
-                        existing_paper = get_paper_by_arxiv_id(db, paper_dict['arxiv_id'])
-                        if existing_paper:
-                            stored_papers[paper_dict['arxiv_id']] = existing_paper
+            # Insert new papers and refresh existing ones in a single statement
+            stored_arxiv_ids = set(upsert_paper_ids(db, top_papers))
             
             # Clear any existing daily featured papers for this date/category
             db.query(DailyFeaturedPaper).filter(
@@ -247,17 +444,22 @@ class PaperService:
                 DailyFeaturedPaper.category == category
             ).delete()
             
-            # Store rankings for all top papers
-            for rank, paper_dict in enumerate(top_papers, 1):
-                paper = stored_papers.get(paper_dict['arxiv_id'])
-                if paper:
-                    daily_featured = DailyFeaturedPaper(
-                        feature_date=target_date,
-                        category=category,
-                        paper_id=paper.id,
-                        rank_in_day=rank
-                    )
-                    db.add(daily_featured)
+            # Store rankings for all top papers in one executemany INSERT
+            rankings = [
+                {
+                    "feature_date": target_date,
+                    "category": category,
+                    "paper_arxiv_id": paper_dict['arxiv_id'],
+                    "rank_in_day": rank
+                }
+                for rank, paper_dict in enumerate(top_papers, 1)
+                if paper_dict['arxiv_id'] in stored_arxiv_ids
+            ]
+            if rankings:
+                db.execute(insert(DailyFeaturedPaper), rankings)
+            
+            if papers_fetched is not None:
+                db.add(self._build_fetch_history(target_date, category, papers_fetched, "success"))
             
             db.commit()
             logger.info(f"Stored daily selection for {target_date}, category: {category} with {len(top_papers)} ranked papers")
@@ -278,23 +480,64 @@ class PaperService:
             category: Category filter (or None)
             
         Returns:
-            Cached paper dictionary or None
+            Cached paper dictionary, _NO_PAPER_FOUND for a cached empty result, or None
         """
         cache_key = self._get_cache_key(target_date, category)
         
-        if cache_key in _paper_cache:
-            cached_entry = _paper_cache[cache_key]
+        with _cache_lock:
+            cached_entry = _paper_cache.get(cache_key)
+            if cached_entry is not None:
+                # Check if expired
+                if time.monotonic() < cached_entry['expires']:
+                    logger.info(f"Cache hit for {cache_key}")
+                    _paper_cache.move_to_end(cache_key)
+                    return cached_entry['paper']
+                else:
+                    # Remove expired entry
+                    del _paper_cache[cache_key]
+                    logger.info(f"Cache expired for {cache_key}")
+        
+        return self._get_shared_cached_paper(cache_key)
+    
+    def _get_shared_cached_paper(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a paper cached in Redis by any worker, copying it into the local cache
+        
+        Args:
+            cache_key: Cache key from _get_cache_key()
             
-            # Check if expired
-            if datetime.now() < cached_entry['expires']:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_entry['paper']
-            else:
-                # Remove expired entry
-                del _paper_cache[cache_key]
-                logger.info(f"Cache expired for {cache_key}")
+        Returns:
+            Cached paper dictionary, _NO_PAPER_FOUND for a cached empty result, or None
+        """
+        redis_client = _get_redis()
+        if redis_client is None:
+            return None
         
-        return None
+        try:
+            redis_key = _REDIS_PAPER_PREFIX + cache_key
+            pipeline = redis_client.pipeline()
+            pipeline.get(redis_key)
+            pipeline.pttl(redis_key)
+            value, ttl_ms = pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Redis cache lookup failed for {cache_key}: {e}")
+            return None
+        
+        if value is None or ttl_ms <= 0:
+            return None
+        
+        paper = orjson.loads(value)
+        if paper is None:
+            paper = _NO_PAPER_FOUND
+        else:
+            # JSON round-trips dates as ISO strings
+            for field in ('submitted_date', 'updated_date'):
+                if paper.get(field):
+                    paper[field] = date.fromisoformat(paper[field])
+        
+        logger.info(f"Shared cache hit for {cache_key}")
+        self._store_local_cache_entry(cache_key, paper, time.monotonic() + ttl_ms / 1000)
+        return paper
     
     def _cache_paper(self, target_date: date, category: str, paper: Dict[str, Any]):
         """
@@ -303,20 +546,105 @@ class PaperService:
         Args:
             target_date: The date for the paper
             category: Category filter (or None)
-            paper: Paper dictionary to cache
+            paper: Paper dictionary to cache, or _NO_PAPER_FOUND for an empty result
         """
         cache_key = self._get_cache_key(target_date, category)
-        expires = datetime.now() + timedelta(hours=settings.cache_ttl_hours)
         
-        _paper_cache[cache_key] = {
-            'paper': paper,
-            'timestamp': datetime.now(),
-            'expires': expires
-        }
+        # Empty results expire sooner so that newly available data gets picked up
+        if paper is _NO_PAPER_FOUND:
+            ttl = timedelta(minutes=settings.negative_cache_ttl_minutes)
+        else:
+            ttl = timedelta(hours=settings.cache_ttl_hours)
+        
+        self._store_local_cache_entry(cache_key, paper, time.monotonic() + ttl.total_seconds())
+        
+        redis_client = _get_redis()
+        if redis_client is not None:
+            value = b"null" if paper is _NO_PAPER_FOUND else orjson.dumps(paper)
+            try:
+                redis_client.set(_REDIS_PAPER_PREFIX + cache_key, value, ex=int(ttl.total_seconds()))
+            except Exception as e:
+                logger.warning(f"Failed to write {cache_key} to the Redis cache: {e}")
         
-        logger.info(f"Cached paper for {cache_key}, expires: {expires}")
+        logger.info(f"Cached paper for {cache_key}, expires in {ttl}")
+    
+    @staticmethod
+    def _store_local_cache_entry(cache_key: str, paper: Dict[str, Any], expires: float):
+        """Put an entry in the in-process cache, evicting the least recently used beyond the bound"""
+        with _cache_lock:
+            _paper_cache[cache_key] = {
+                'paper': paper,
+                'expires': expires
+            }
+            _paper_cache.move_to_end(cache_key)
+            
+            # Evict least recently used entries beyond the bound
+            while len(_paper_cache) > settings.cache_max_entries:
+                _paper_cache.popitem(last=False)
     
-    def _get_cache_key(self, target_date: date, category: str) -> str:
+    @contextmanager
+    def _cache_fill_lock(self, target_date: date, category: str):
+        """
+        Hold a lock while filling the cache for a date and category, so only
+        one thread fetches from the external APIs on a miss
+        
+        A per-key lock serializes threads within this process. When Redis is
+        configured, a Redis lock additionally serializes worker processes;
+        it waits up to settings.cache_fill_lock_seconds for another worker's
+        fetch, then proceeds regardless.
+        
+        Args:
+            target_date: The date for the paper
+            category: Category filter (or None)
+        """
+        cache_key = self._get_cache_key(target_date, category)
+        
+        with _fill_locks_guard:
+            fill_lock = _fill_locks.setdefault(cache_key, [threading.Lock(), 0])
+            fill_lock[1] += 1
+        
+        try:
+            with fill_lock[0]:
+                with self._redis_fill_lock(cache_key):
+                    yield
+        finally:
+            with _fill_locks_guard:
+                fill_lock[1] -= 1
+                if not fill_lock[1]:
+                    del _fill_locks[cache_key]
+    
+    @contextmanager
+    def _redis_fill_lock(self, cache_key: str):
+        """Hold the Redis lock for a cache key, see _cache_fill_lock(); does nothing without Redis"""
+        redis_client = _get_redis()
+        if redis_client is None:
+            yield
+            return
+        
+        lock = redis_client.lock(
+            _REDIS_LOCK_PREFIX + cache_key,
+            timeout=settings.cache_fill_lock_seconds,
+            blocking_timeout=settings.cache_fill_lock_seconds
+        )
+        
+        try:
+            acquired = lock.acquire()
+        except Exception as e:
+            logger.warning(f"Failed to take the Redis cache lock for {cache_key}: {e}")
+            acquired = False
+        
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except Exception as e:
+                    # The lock may have timed out during a slow fetch
+                    logger.warning(f"Failed to release the Redis cache lock for {cache_key}: {e}")
+    
+    @staticmethod
+    def _get_cache_key(target_date: date, category: str) -> str:
         """
         Generate cache key for date and category
         
@@ -327,8 +655,7 @@ class PaperService:
         Returns:
             Cache key string
         """
-        category_str = category if category else "all"
-        return f"{target_date.strftime('%Y-%m-%d')}_{category_str}"
+        return f"{target_date.isoformat()}_{category or 'all'}"
     
     def _log_fetch_history(self, target_date: date, category: str, papers_fetched: int, status: str, error_message: str = None):
         """
@@ -343,18 +670,7 @@ class PaperService:
         """
         db = SessionLocal()
         try:
-            fetch_type = "category" if category else "daily"
-            
-            fetch_history = FetchHistory(
-                fetch_date=target_date,
-                fetch_type=fetch_type,
-                category=category,
-                papers_fetched=papers_fetched,
-                status=status,
-                error_message=error_message
-            )
-            
-            db.add(fetch_history)
+            db.add(self._build_fetch_history(target_date, category, papers_fetched, status, error_message))
             db.commit()
             
         except Exception as e:
@@ -362,21 +678,34 @@ class PaperService:
             db.rollback()
         finally:
             db.close()
+    
+    @staticmethod
+    def _build_fetch_history(target_date: date, category: str, papers_fetched: int, status: str,
+                             error_message: str = None) -> FetchHistory:
+        """Create a fetch history row for a fetch operation"""
+        return FetchHistory(
+            fetch_date=target_date,
+            fetch_type="category" if category else "daily",
+            category=category,
+            papers_fetched=papers_fetched,
+            status=status,
+            error_message=error_message
+        )
 
 
 # Cache management functions
 def clear_expired_cache():
     """Clear expired entries from cache"""
-    global _paper_cache
-    current_time = datetime.now()
-    expired_keys = []
+    current_time = time.monotonic()
     
-    for cache_key, cache_entry in _paper_cache.items():
-        if current_time >= cache_entry['expires']:
-            expired_keys.append(cache_key)
-    
-    for key in expired_keys:
-        del _paper_cache[key]
+    with _cache_lock:
+        expired_keys = [
+            cache_key for cache_key, cache_entry in _paper_cache.items()
+            if current_time >= cache_entry['expires']
+        ]
+        
+        for key in expired_keys:
+            del _paper_cache[key]
     
     if expired_keys:
         logger.info(f"Cleared {len(expired_keys)} expired cache entries")
@@ -384,32 +713,104 @@ def clear_expired_cache():
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics"""
-    current_time = datetime.now()
+    current_time = time.monotonic()
     valid_entries = 0
     expired_entries = 0
+    negative_entries = 0
     
-    for cache_entry in _paper_cache.values():
-        if current_time < cache_entry['expires']:
-            valid_entries += 1
-        else:
-            expired_entries += 1
+    with _cache_lock:
+        for cache_entry in _paper_cache.values():
+            if current_time < cache_entry['expires']:
+                valid_entries += 1
+                if cache_entry['paper'] is _NO_PAPER_FOUND:
+                    negative_entries += 1
+            else:
+                expired_entries += 1
+        total_entries = len(_paper_cache)
     
     return {
-        'total_entries': len(_paper_cache),
+        'total_entries': total_entries,
         'valid_entries': valid_entries,
         'expired_entries': expired_entries,
+        'negative_entries': negative_entries,
+        'max_entries': settings.cache_max_entries,
         'cache_ttl_hours': settings.cache_ttl_hours
     }
 
 
+def invalidate_cache(target_date: date, category: str = None) -> bool:
+    """
+    Remove the cached selection for a date and category
+    
+    Returns:
+        True if an entry was removed
+    """
+    cache_key = PaperService._get_cache_key(target_date, category)
+    
+    with _cache_lock:
+        removed = _paper_cache.pop(cache_key, None) is not None
+    
+    redis_client = _get_redis()
+    if redis_client is not None:
+        try:
+            removed = bool(redis_client.delete(_REDIS_PAPER_PREFIX + cache_key)) or removed
+        except Exception as e:
+            logger.warning(f"Failed to invalidate {cache_key} in the Redis cache: {e}")
+    
+    if removed:
+        logger.info(f"Invalidated cache entry {cache_key}")
+    return removed
+
+
+def clear_cache_scope(category: str = None) -> int:
+    """
+    Remove every cached selection for a category (None for the main page)
+    
+    Returns:
+        Number of entries removed
+    """
+    category_str = category if category else "all"
+    
+    with _cache_lock:
+        scoped_keys = [key for key in _paper_cache if key.partition('_')[2] == category_str]
+        for key in scoped_keys:
+            del _paper_cache[key]
+    
+    _delete_shared_cache_keys(f"{_REDIS_PAPER_PREFIX}*_{category_str}")
+    
+    logger.info(f"Cleared {len(scoped_keys)} cache entries for category {category_str}")
+    return len(scoped_keys)
+
+
 def clear_all_cache():
     """Clear all cache entries"""
-    global _paper_cache
-    cache_size = len(_paper_cache)
-    _paper_cache.clear()
+    with _cache_lock:
+        cache_size = len(_paper_cache)
+        _paper_cache.clear()
+    _delete_shared_cache_keys(f"{_REDIS_PAPER_PREFIX}*")
     logger.info(f"Cleared all {cache_size} cache entries")
 
 
+def _delete_shared_cache_keys(pattern: str):
+    """Delete Redis cache keys matching a glob pattern, if Redis is configured"""
+    redis_client = _get_redis()
+    if redis_client is None:
+        return
+    
+    try:
+        keys = list(redis_client.scan_iter(match=pattern))
+        if keys:
+            redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Failed to clear Redis cache keys matching {pattern}: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_paper_service() -> PaperService:
+    """Get the shared PaperService instance so its HTTP connections are reused"""
+    return PaperService()
+
+
 # Convenience functions for easier usage
 def get_daily_paper(target_date: date, category: str = None) -> Optional[Dict[str, Any]]:
     """
@@ -422,7 +823,7 @@ def get_daily_paper(target_date: date, category: str = None) -> Optional[Dict[st
     Returns:
         Paper dictionary or None
     """
-    service = PaperService()
+    service = get_paper_service()
     return service.get_daily_paper(target_date, category)
 
 
@@ -436,7 +837,7 @@ def get_last_10_years_dates(target_date: date) -> List[date]:
     Returns:
         List of historical dates
     """
-    service = PaperService()
+    service = get_paper_service()
     return service.get_last_10_years_dates(target_date)
 
 
@@ -451,7 +852,7 @@ def fetch_and_enrich_papers(dates: List[date], category: str = None) -> List[Dic
     Returns:
         List of enriched paper dictionaries
     """
-    service = PaperService()
+    service = get_paper_service()
     return service.fetch_and_enrich_papers(dates, category)
 
 
@@ -466,7 +867,7 @@ def select_top_papers(papers: List[Dict[str, Any]], count: int = 10) -> List[Dic
     Returns:
         List of top papers
     """
-    service = PaperService()
+    service = get_paper_service()
     return service.select_top_papers(papers, count)
 
 
@@ -480,5 +881,5 @@ def store_daily_selection(target_date: date, category: str, top_papers: List[Dic
         top_papers: List of top papers
         selected_paper: The selected paper
     """
-    service = PaperService()
+    service = get_paper_service()
     return service.store_daily_selection(target_date, category, top_papers, selected_paper)
\ No newline at end of file
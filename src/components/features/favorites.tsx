@@ -41,7 +41,13 @@ export function FavoritesProvider({ children }: { children: React.ReactNode }) {
       const stored = localStorage.getItem(FAVORITES_STORAGE_KEY);
       if (stored) {
         const parsed = JSON.parse(stored);
-        setFavorites(Array.isArray(parsed) ? parsed : []);
+        // Favorites saved before paper ids became arXiv IDs are keyed on the
+        // old numeric database id; re-key them so they still match.
+        setFavorites(
+          Array.isArray(parsed)
+            ? parsed.map((fav: FavoritePaper) => (fav.arxivId ? { ...fav, id: fav.arxivId } : fav))
+            : []
+        );
       }
     } catch (error) {
       console.warn('Failed to load favorites:', error);
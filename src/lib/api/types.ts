@@ -9,7 +9,7 @@ export interface Author {
 }
 
 export interface Paper {
-  id: string;
+  id: string; // arXiv ID (same as arxivId); was the numeric database id before
   arxivId: string;
   title: string;
   abstract: string;